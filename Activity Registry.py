@@ -0,0 +1,314 @@
+import pandas as pd
+import numpy as np
+import argparse
+import contextlib
+import importlib.util
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Create activities dataframe
+activities_data = pd.DataFrame({
+    'Activity_Code': ['A', 'B', 'C1', 'C2', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N',
+                     'O1', 'O2', 'P1', 'P2', 'P3', 'Q1', 'Q2', 'R1', 'R2', 'R3', 'S1', 'S2', 'S3',
+                     'T1', 'T2', 'U', 'V', 'W1', 'W2', 'X', 'Y'],
+    'Duration': [1, 8, 2, 7, 3, 7, 3, 6, 4, 3, 5, 2, 3, 9, 8,
+                 2, 2, 2, 2, 2, 22, 22, 3, 3, 3, 2, 2, 2,
+                 3, 3, 12, 12, 8, 8, 6, 1],
+    'Foremen': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+                1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 1, 1, 1,
+                1, 1, 1, 1, 1, 1, 1, 2],
+    'Workers': [2, 2, 2, 2, 2, 2, 2, 2, 3, 2, 2, 2, 2, 2, 2,
+                2, 2, 2, 2, 2, 2, 2, 3, 3, 3, 2, 2, 2,
+                2, 2, 2, 2, 2, 2, 2, 0]
+})
+
+# Create dependencies dataframe
+dependencies_data = pd.DataFrame({
+    'Activity_Code': activities_data['Activity_Code'],
+    'Prior_Activities': ['-', 'A', 'B', 'C1', 'C2', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M',
+                        'M', 'O1', 'M', 'P1', 'P2', 'N,O2,P3', 'Q1', 'Q2', 'R1', 'R2', 'Q2', 'S1', 'S2',
+                        'R3,S3', 'T1', 'T2', 'U', 'V', 'W1', 'W2', 'X']
+})
+
+# Typed storage for the attributes used across the analysis scripts
+REGISTRY_COLUMNS = {
+    'Duration': np.int32,
+    'Optimistic': np.int32,
+    'Most_Likely': np.int32,
+    'Pessimistic': np.int32,
+    'Budget_Cost': np.float64,
+    'Actual_Cost': np.float64,
+    'Percent_Complete': np.float32,
+    'Foremen': np.int16,
+    'Workers': np.int16
+}
+
+class ActivityRecord:
+    # Lightweight view of one registry row; attributes are read from the typed arrays
+    __slots__ = ('registry', 'id')
+    
+    def __init__(self, registry, activity_id):
+        self.registry = registry
+        self.id = activity_id
+    
+    @property
+    def code(self):
+        return self.registry['codes'][self.id]
+    
+    @property
+    def predecessors(self):
+        start, end = self.registry['pred_ptr'][self.id], self.registry['pred_ptr'][self.id + 1]
+        return [self.registry['codes'][p] for p in self.registry['pred_idx'][start:end]]
+    
+    def __getattr__(self, name):
+        columns = self.registry['columns']
+        if name not in columns:
+            raise AttributeError(name)
+        return columns[name][self.id].item()
+    
+    def __repr__(self):
+        return f"ActivityRecord({self.code!r}, id={self.id})"
+
+def intern_codes(codes):
+    # One shared string object per code; dense integer IDs in input order
+    codes = [sys.intern(str(code)) for code in codes]
+    index = {code: i for i, code in enumerate(codes)}
+    if len(index) != len(codes):
+        raise ValueError("Duplicate activity codes")
+    return codes, index
+
+def build_activity_registry(activities_df, dependencies_df=None):
+    codes, index = intern_codes(activities_df['Activity_Code'])
+    columns = {}
+    for name, dtype in REGISTRY_COLUMNS.items():
+        if name not in activities_df.columns:
+            continue
+        values = activities_df[name].to_numpy()
+        columns[name] = values.astype(dtype)
+        # Integer columns would silently truncate fractions or wrap large values
+        if np.issubdtype(dtype, np.integer) and not np.array_equal(columns[name], values):
+            raise ValueError(f"{name} must hold whole numbers that fit in {np.dtype(dtype).name}")
+    
+    # Predecessors in CSR form: pred_idx[pred_ptr[i]:pred_ptr[i + 1]] are i's predecessors
+    pred_ptr = np.zeros(len(codes) + 1, dtype=np.int32)
+    pred_idx = np.zeros(0, dtype=np.int32)
+    if dependencies_df is not None:
+        links = dependencies_df.assign(Predecessor=dependencies_df['Prior_Activities'].fillna('-').str.split(','))
+        links = links.explode('Predecessor')
+        links = links[links['Predecessor'].str.strip() != '-']
+        unknown = sorted({c for c in links['Activity_Code'] if c not in index} |
+                         {p.strip() for p in links['Predecessor'] if p.strip() not in index})
+        if unknown:
+            raise ValueError(f"Links to unknown activities: {', '.join(unknown)}")
+        succ = np.fromiter((index[c] for c in links['Activity_Code']), dtype=np.int32, count=len(links))
+        pred = np.fromiter((index[p.strip()] for p in links['Predecessor']), dtype=np.int32, count=len(links))
+        order = np.argsort(succ, kind='stable')
+        pred_idx = pred[order]
+        np.cumsum(np.bincount(succ, minlength=len(codes)), out=pred_ptr[1:])
+    
+    return {
+        'codes': codes,
+        'index': index,
+        'columns': columns,
+        'pred_ptr': pred_ptr,
+        'pred_idx': pred_idx
+    }
+
+def activity_id(registry, code):
+    return registry['index'][code]
+
+def get_activity(registry, code):
+    return ActivityRecord(registry, registry['index'][code])
+
+def registry_edges(registry):
+    # (predecessor, successor) ID arrays
+    succ = np.repeat(np.arange(len(registry['codes']), dtype=np.int32), np.diff(registry['pred_ptr']))
+    return registry['pred_idx'], succ
+
+def registry_frame(registry):
+    # DataFrame view for pandas-based analyses; codes become a categorical over the IDs
+    frame = pd.DataFrame(registry['columns'])
+    frame.insert(0, 'Activity_Code', pd.Categorical.from_codes(np.arange(len(registry['codes'])),
+                                                               categories=registry['codes']))
+    return frame
+
+def registry_dependencies(registry):
+    # Prior_Activities strings for the scripts that still parse the text form
+    pred_ptr, pred_idx, codes = registry['pred_ptr'], registry['pred_idx'], registry['codes']
+    return pd.DataFrame({
+        'Activity_Code': codes,
+        'Prior_Activities': [','.join(codes[p] for p in pred_idx[pred_ptr[i]:pred_ptr[i + 1]]) or '-'
+                             for i in range(len(codes))]
+    })
+
+def calculate_registry_cpm(registry):
+    # Same results as calculate_cpm, on integer IDs: longest-path relaxation over the edge arrays
+    duration = registry['columns']['Duration'].astype(np.int64)
+    pred, succ = registry_edges(registry)
+    
+    # A longest path has fewer links than activities, so more sweeps than that mean a cycle
+    es = np.zeros(len(duration), dtype=np.int64)
+    for _ in range(len(duration) + 1):
+        new_es = es.copy()
+        np.maximum.at(new_es, succ, es[pred] + duration[pred])
+        if np.array_equal(new_es, es):
+            break
+        es = new_es
+    else:
+        raise ValueError("Dependency cycle in the activity network")
+    ef = es + duration
+    project_duration = int(ef.max()) if len(ef) else 0
+    
+    lf = np.full(len(duration), project_duration, dtype=np.int64)
+    for _ in range(len(duration) + 1):
+        new_lf = lf.copy()
+        np.minimum.at(new_lf, pred, lf[succ] - duration[succ])
+        if np.array_equal(new_lf, lf):
+            break
+        lf = new_lf
+    else:
+        raise ValueError("Dependency cycle in the activity network")
+    total_float = lf - ef
+    
+    return {
+        'project_duration': project_duration,
+        'critical_path': [registry['codes'][i] for i in np.flatnonzero(total_float == 0)],
+        'ES': es,
+        'EF': ef,
+        'LS': lf - duration,
+        'LF': lf,
+        'Total_Float': total_float
+    }
+
+def registry_cpm_results(registry, cpm):
+    # calculate_cpm-shaped results, so existing analyses (analyze_resources, analyze_risks,
+    # create_gantt_chart, ...) accept registry_frame(registry) with these results
+    results_df = pd.DataFrame({
+        'Activity': pd.Categorical.from_codes(np.arange(len(registry['codes'])), categories=registry['codes']),
+        'Duration': registry['columns']['Duration'],
+        'ES': cpm['ES'],
+        'EF': cpm['EF'],
+        'LS': cpm['LS'],
+        'LF': cpm['LF'],
+        'Total_Float': cpm['Total_Float'],
+        'Critical': cpm['Total_Float'] == 0
+    })
+    return {
+        'project_duration': cpm['project_duration'],
+        'critical_path': cpm['critical_path'],
+        'results': results_df
+    }
+
+def calculate_registry_resources(registry, cpm):
+    # Daily crew demand with difference arrays, in the shape analyze_resources reports
+    usage = {}
+    for resource in ['Foremen', 'Workers']:
+        delta = np.zeros(cpm['project_duration'] + 2)
+        np.add.at(delta, cpm['ES'], registry['columns'][resource])
+        np.subtract.at(delta, cpm['EF'], registry['columns'][resource])
+        usage[resource] = np.cumsum(delta)[:cpm['project_duration'] + 1]
+    return {
+        'Peak_Foremen': usage['Foremen'].max(),
+        'Peak_Workers': usage['Workers'].max(),
+        'Avg_Foremen': usage['Foremen'].mean(),
+        'Avg_Workers': usage['Workers'].mean(),
+        'Daily_Foremen': usage['Foremen'],
+        'Daily_Workers': usage['Workers']
+    }
+
+def load_script(filename):
+    # The analysis scripts run their sample project on load; keep that output quiet
+    path = os.path.join(SCRIPT_DIR, filename)
+    spec = importlib.util.spec_from_file_location(filename[:-3].replace(' ', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    with contextlib.redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(module)
+    return module
+
+def traced_bytes(build):
+    # Net bytes still allocated by build() when it returns, and the result
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+def benchmark_registry_memory(n_activities, lookups=100, seed=42):
+    generator = load_script('Synthetic Project Generator.py')
+    activities_df, dependencies_df = generator.generate_project(n_activities, seed=seed)
+    
+    # Current representation: DataFrames with string codes plus the per-activity
+    # dict-of-dicts calculate_cpm builds for early and late times
+    frame_bytes = int(activities_df.memory_usage(deep=True).sum() + dependencies_df.memory_usage(deep=True).sum())
+    codes = list(activities_df['Activity_Code'])
+    dict_bytes, _ = traced_bytes(lambda: [{c: {'ES': i, 'EF': i + 1} for i, c in enumerate(codes)},
+                                          {c: {'LS': i, 'LF': i + 1} for i, c in enumerate(codes)}])
+    del codes
+    
+    # Registry plus CPM result arrays
+    registry_bytes, registry = traced_bytes(lambda: build_activity_registry(activities_df, dependencies_df))
+    # Interned codes share the DataFrame's string objects, so tracemalloc does not see them;
+    # count them as registry storage too, as memory_usage(deep=True) does for the baseline
+    registry_bytes += sum(sys.getsizeof(code) for code in registry['codes'])
+    cpm_bytes, cpm = traced_bytes(lambda: calculate_registry_cpm(registry))
+    
+    # Code -> attribute lookups: boolean-mask .loc as in the resource and risk scripts vs. registry
+    rng = np.random.default_rng(seed)
+    sample = [registry['codes'][i] for i in rng.integers(0, n_activities, lookups)]
+    start_time = time.perf_counter()
+    for code in sample:
+        activities_df.loc[activities_df['Activity_Code'] == code, 'Foremen'].values[0]
+    mask_seconds = (time.perf_counter() - start_time) / lookups
+    start_time = time.perf_counter()
+    for code in sample:
+        registry['columns']['Foremen'][registry['index'][code]]
+    registry_seconds = (time.perf_counter() - start_time) / lookups
+    
+    return {
+        'Activities': n_activities,
+        'Baseline_Bytes': frame_bytes + dict_bytes,
+        'Registry_Bytes': registry_bytes + cpm_bytes,
+        'Baseline_Per_Activity': (frame_bytes + dict_bytes) / n_activities,
+        'Registry_Per_Activity': (registry_bytes + cpm_bytes) / n_activities,
+        'Mask_Lookup_Seconds': mask_seconds,
+        'Registry_Lookup_Seconds': registry_seconds,
+        'Project_Duration': cpm['project_duration']
+    }
+
+if __name__ == '__main__':
+    # Guarded so other scripts can load the registry without running the benchmark
+    parser = argparse.ArgumentParser(description='Compact activity registry and memory benchmark')
+    parser.add_argument('--benchmark-size', type=int, default=1_000_000)
+    args = parser.parse_args()
+    
+    registry = build_activity_registry(activities_data, dependencies_data)
+    cpm_results = calculate_registry_cpm(registry)
+    resource_metrics = calculate_registry_resources(registry, cpm_results)
+    roof = get_activity(registry, 'Q1')
+    
+    # Print Results
+    print("\nACTIVITY REGISTRY")
+    print("=" * 80)
+    print(f"Activities: {len(registry['codes'])}, links: {len(registry['pred_idx'])}")
+    print(f"Project Duration: {cpm_results['project_duration']} days")
+    print(f"Critical Path: {' -> '.join(cpm_results['critical_path'])}")
+    print(f"Peak Resources: {resource_metrics['Peak_Foremen']:.0f} foremen, {resource_metrics['Peak_Workers']:.0f} workers")
+    print(f"{roof}: {roof.Duration} days, {roof.Foremen} foremen, {roof.Workers} workers, "
+          f"after {', '.join(roof.predecessors)}")
+    
+    benchmark = benchmark_registry_memory(args.benchmark_size)
+    print(f"\nMemory Benchmark ({benchmark['Activities']:,} activities):")
+    print("-" * 50)
+    print(f"DataFrames + CPM dicts: {benchmark['Baseline_Bytes'] / 2**20:,.1f} MB "
+          f"({benchmark['Baseline_Per_Activity']:.0f} bytes/activity)")
+    print(f"Registry + CPM arrays: {benchmark['Registry_Bytes'] / 2**20:,.1f} MB "
+          f"({benchmark['Registry_Per_Activity']:.0f} bytes/activity)")
+    print(f"Reduction: {benchmark['Baseline_Bytes'] / benchmark['Registry_Bytes']:.1f}x")
+    print(f"Code lookup: {benchmark['Mask_Lookup_Seconds'] * 1e3:.2f} ms (DataFrame mask) vs "
+          f"{benchmark['Registry_Lookup_Seconds'] * 1e6:.2f} us (registry)")
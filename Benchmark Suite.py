@@ -0,0 +1,219 @@
+import pandas as pd
+import numpy as np
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import signal
+import subprocess
+import time
+from datetime import datetime, timedelta
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def load_script(filename):
+    # The analysis scripts run their sample project on load; keep that output quiet
+    path = os.path.join(SCRIPT_DIR, filename)
+    spec = importlib.util.spec_from_file_location(filename[:-3].replace(' ', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    with contextlib.redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(module)
+    return module
+
+def current_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=SCRIPT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def time_call(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+def time_call_with_budget(budget_seconds, func, *args, **kwargs):
+    # Small sizes are dominated by fixed overhead, so extrapolation can underestimate a
+    # superlinear stage; a timer stops it at the budget. SIGALRM is Unix-only; elsewhere
+    # only the extrapolated estimate applies.
+    if not hasattr(signal, 'SIGALRM'):
+        return time_call(func, *args, **kwargs)
+    
+    def expire(signum, frame):
+        raise TimeoutError
+    
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, budget_seconds)
+    try:
+        return time_call(func, *args, **kwargs)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+def build_benchmarks(scripts):
+    cpm = scripts['cpm']
+    pert = scripts['pert']
+    resources = scripts['resources']
+    risk = scripts['risk']
+    eva = scripts['eva']
+    
+    def run_cpm(project, state):
+        state['cpm_results'] = cpm.calculate_cpm(project['activities'], project['dependencies'])
+    
+    def run_pert(project, state):
+        activities = project['activities']
+        pert_results = pert.calculate_pert_estimates(activities[['Activity_Code', 'Optimistic', 'Most_Likely',
+                                                                 'Pessimistic']].copy())
+        network = pert.build_schedule_network(list(activities['Activity_Code']), project['dependencies'])
+        # Keep each sample chunk around 10M values so large networks fit in memory
+        chunk_size = max(1, 10_000_000 // len(activities))
+        pert.calculate_schedule_sensitivity(pert_results, network, n_samples=1000, chunk_size=chunk_size)
+    
+    def run_resources(project, state):
+        state['resource_metrics'], _ = resources.analyze_resources(project['activities'], state['cpm_results'])
+    
+    def run_risk(project, state):
+        risk.analyze_risks(project['activities'], state['cpm_results'], state['resource_metrics'],
+                           risk.risk_rules)
+    
+    def run_eva(project, state):
+        eva.perform_earned_value_analysis(project['activities'], datetime(2024, 1, 1) + timedelta(days=30))
+        eva.analyze_cost_variance(project['activities'])
+    
+    # Each analysis with the earlier analyses whose results it needs
+    return [
+        ('CPM', run_cpm, []),
+        ('PERT_Monte_Carlo', run_pert, []),
+        ('Resource_Profile', run_resources, ['CPM']),
+        ('Risk_Analysis', run_risk, ['CPM', 'Resource_Profile']),
+        ('Earned_Value', run_eva, [])
+    ]
+
+def generate_benchmark_project(generator, n_activities, seed):
+    # Deeper networks for larger projects, roughly like programmes built from many phases
+    depth = int(max(10, np.sqrt(n_activities) * 2))
+    return generator.generate_project(n_activities, depth=depth, seed=seed)
+
+def extrapolate_seconds(timings, n_activities):
+    # Growth exponent fitted on the last two sizes (linear if only one is known)
+    previous_n, previous_seconds = timings[-1]
+    if previous_seconds is None:
+        return None
+    exponent = 1.0
+    if len(timings) > 1 and timings[-2][1]:
+        earlier_n, earlier_seconds = timings[-2]
+        exponent = np.clip(np.log(previous_seconds / earlier_seconds) / np.log(previous_n / earlier_n), 1, 3)
+    return previous_seconds * (n_activities / previous_n) ** exponent
+
+def run_benchmarks(sizes, budget_seconds=60, seed=42):
+    generator = load_script('Synthetic Project Generator.py')
+    scripts = {
+        'cpm': load_script('CPM method.py'),
+        'pert': load_script('PERT method.py'),
+        'resources': load_script('Resource Utilization.py'),
+        'risk': load_script('Risk Analysis.py'),
+        'eva': load_script('Cost and Earned Value Analysis.py')
+    }
+    benchmarks = build_benchmarks(scripts)
+    
+    results = []
+    timings = {}
+    for n_activities in sorted(sizes):
+        activities_df, dependencies_df = generate_benchmark_project(generator, n_activities, seed)
+        project = {'activities': activities_df, 'dependencies': dependencies_df}
+        state = {}
+        completed = set()
+    
+        for name, run, requires in benchmarks:
+            record = {'Analysis': name, 'Activities': n_activities, 'Seconds': None}
+    
+            # Skip sizes whose extrapolated time is already over budget
+            if name in timings:
+                estimate = extrapolate_seconds(timings[name], n_activities)
+                if estimate is None or estimate > budget_seconds:
+                    record['Status'] = 'skipped (over budget)'
+                    timings[name].append((n_activities, None))
+                    results.append(record)
+                    continue
+    
+            if not all(r in completed for r in requires):
+                record['Status'] = 'skipped (missing inputs)'
+                results.append(record)
+                continue
+    
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    seconds, _ = time_call_with_budget(budget_seconds, run, project, state)
+            except TimeoutError:
+                # Larger sizes of this analysis are skipped as over budget too
+                record['Status'] = f'stopped (over {budget_seconds:g} s budget)'
+                timings.setdefault(name, []).append((n_activities, None))
+                results.append(record)
+                print(f"{name:<20} {n_activities:>8} activities  stopped at {budget_seconds:g} s budget")
+                continue
+            record['Seconds'] = seconds
+            record['Status'] = 'ok'
+            timings.setdefault(name, []).append((n_activities, seconds))
+            completed.add(name)
+            results.append(record)
+            print(f"{name:<20} {n_activities:>8} activities  {seconds:9.3f} s")
+    
+    return pd.DataFrame(results)
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def save_history(path, history):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(history, f, indent=2)
+
+def compare_with_previous(history, results_df):
+    # Ratio of this run's time to the most recent earlier run with the same case
+    previous = {}
+    for run in history:
+        for record in run['Results']:
+            if record['Seconds'] is not None:
+                previous[(record['Analysis'], record['Activities'])] = record['Seconds']
+    
+    comparison = results_df.copy()
+    comparison['Previous_Seconds'] = [
+        previous.get((row['Analysis'], row['Activities'])) for _, row in results_df.iterrows()
+    ]
+    comparison['Ratio'] = comparison['Seconds'] / comparison['Previous_Seconds']
+    return comparison
+
+parser = argparse.ArgumentParser(description='Time the analysis scripts on synthetic projects')
+parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1_000, 10_000, 100_000])
+parser.add_argument('--budget', type=float, default=60, help='skip sizes expected to exceed this many seconds')
+parser.add_argument('--seed', type=int, default=42)
+parser.add_argument('--history', default=os.path.join(SCRIPT_DIR, 'benchmark-history.json'))
+args = parser.parse_args()
+
+print("\nBENCHMARK RESULTS")
+print("=" * 80)
+results_df = run_benchmarks(args.sizes, budget_seconds=args.budget, seed=args.seed)
+
+history = load_history(args.history)
+comparison = compare_with_previous(history, results_df)
+
+print("\nComparison with Previous Run:")
+print("-" * 50)
+print(comparison.to_string(index=False, float_format=lambda v: f"{v:.3f}"))
+
+history.append({
+    'Timestamp': datetime.now().isoformat(timespec='seconds'),
+    'Commit': current_commit(),
+    'Python': platform.python_version(),
+    'NumPy': np.__version__,
+    'Pandas': pd.__version__,
+    'Seed': args.seed,
+    'Results': results_df.replace({np.nan: None}).to_dict('records')
+})
+save_history(args.history, history)
+print(f"\nResults appended to {args.history}")
@@ -1,5 +1,7 @@
 import pandas as pd
+import numpy as np
 import networkx as nx
+import heapq
 
 # Create activities dataframe
 activities_data = pd.DataFrame({
@@ -82,16 +84,98 @@ def calculate_cpm(activities_df, dependencies_df):
         'Critical': [n in critical_path for n in G.nodes()]
     })
     
+    results_df = calculate_float_breakdown(G, results_df)
+    
     return {
         'project_duration': project_duration,
         'critical_path': critical_path,
-        'results': results_df
+        'results': results_df,
+        'graph': G
     }
 
+def calculate_float_breakdown(G, results_df):
+    # Map activity codes to row positions so every edge becomes a pair of array indices
+    index = {node: i for i, node in enumerate(results_df['Activity'])}
+    edges = list(G.edges())
+    pred_idx = np.array([index[u] for u, _ in edges], dtype=np.int64)
+    succ_idx = np.array([index[v] for _, v in edges], dtype=np.int64)
+    
+    duration = results_df['Duration'].to_numpy()
+    es = results_df['ES'].to_numpy()
+    ef = results_df['EF'].to_numpy()
+    lf = results_df['LF'].to_numpy()
+    total_float = results_df['Total_Float'].to_numpy()
+    project_duration = ef.max()
+    
+    # Earliest start among successors (project end for activities without successors)
+    min_succ_es = np.full(len(results_df), project_duration, dtype=es.dtype)
+    np.minimum.at(min_succ_es, pred_idx, es[succ_idx])
+    
+    # Latest finish among predecessors (project start for activities without predecessors)
+    max_pred_lf = np.zeros(len(results_df), dtype=lf.dtype)
+    np.maximum.at(max_pred_lf, succ_idx, lf[pred_idx])
+    
+    free_float = min_succ_es - ef
+    
+    results_df['Free_Float'] = free_float
+    results_df['Independent_Float'] = np.maximum(0, min_succ_es - max_pred_lf - duration)
+    results_df['Interfering_Float'] = total_float - free_float
+    
+    return results_df
+
+def find_k_longest_paths(G, k=5):
+    # k-best dynamic programming over the DAG: every node keeps only the k longest
+    # paths ending at it as (length, predecessor, predecessor_rank) back-pointers,
+    # so the work is O(E * k log k) instead of enumerating every path.
+    best = {}
+    for node in nx.topological_sort(G):
+        duration = G.nodes[node]['duration']
+        predecessors = list(G.predecessors(node))
+        if not predecessors:
+            best[node] = [(duration, None, None)]
+            continue
+        
+        candidates = (
+            (length + duration, p, rank)
+            for p in predecessors
+            for rank, (length, _, _) in enumerate(best[p])
+        )
+        best[node] = heapq.nlargest(k, candidates, key=lambda c: c[0])
+    
+    sinks = [node for node in G.nodes() if G.out_degree(node) == 0]
+    ends = heapq.nlargest(
+        k,
+        ((best[s][rank][0], s, rank) for s in sinks for rank in range(len(best[s]))),
+        key=lambda c: c[0]
+    )
+    
+    paths = []
+    for length, node, rank in ends:
+        path = []
+        while node is not None:
+            path.append(node)
+            _, node, rank = best[node][rank]
+        paths.append({'path': path[::-1], 'length': length})
+    
+    return paths
+
+def find_critical_paths(cpm_results, k=10):
+    # Separate parallel critical chains instead of one flat list of zero-float activities
+    longest_paths = find_k_longest_paths(cpm_results['graph'], k)
+    return [p for p in longest_paths if p['length'] == cpm_results['project_duration']]
+
 # Run CPM analysis
 results = calculate_cpm(activities_data, dependencies_data)
 
 print(f"\nProject Duration: {results['project_duration']} days")
 print(f"\nCritical Path: {' -> '.join(results['critical_path'])}")
 print("\nDetailed Activity Analysis:")
-print(results['results'].to_string())
\ No newline at end of file
+print(results['results'].to_string())
+
+print("\nCritical Paths:")
+for i, path in enumerate(find_critical_paths(results), 1):
+    print(f"{i}. {' -> '.join(path['path'])} ({path['length']} days)")
+
+print("\nNear-Critical Paths (5 longest):")
+for i, path in enumerate(find_k_longest_paths(results['graph'], k=5), 1):
+    print(f"{i}. {path['length']} days: {' -> '.join(path['path'])}")
\ No newline at end of file
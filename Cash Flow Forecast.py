@@ -0,0 +1,168 @@
+import pandas as pd
+import numpy as np
+import contextlib
+import importlib.util
+import io
+import os
+import time
+from datetime import datetime
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def load_script(filename):
+    # The analysis scripts run their sample project on load; keep that output quiet
+    path = os.path.join(SCRIPT_DIR, filename)
+    spec = importlib.util.spec_from_file_location(filename[:-3].replace(' ', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    with contextlib.redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(module)
+    return module
+
+# Create activities dataframe with cost data
+activities_data = pd.DataFrame({
+    'Activity_Code': ['A', 'B', 'C1', 'C2', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N',
+                     'O1', 'O2', 'P1', 'P2', 'P3', 'Q1', 'Q2', 'R1', 'R2', 'R3', 'S1', 'S2', 'S3',
+                     'T1', 'T2', 'U', 'V', 'W1', 'W2', 'X', 'Y'],
+    'Duration': [1, 8, 2, 7, 3, 7, 3, 6, 4, 3, 5, 2, 3, 9, 8,
+                 2, 2, 2, 2, 2, 22, 22, 3, 3, 3, 2, 2, 2,
+                 3, 3, 12, 12, 8, 8, 6, 1],
+    'Budget_Cost': [1000, 8000, 2000, 7000, 3000, 7000, 3000, 6000, 4000, 3000, 5000, 2000, 3000,
+                    9000, 8000, 2000, 2000, 2000, 2000, 2000, 22000, 22000, 3000, 3000, 3000,
+                    2000, 2000, 2000, 3000, 3000, 12000, 12000, 8000, 8000, 6000, 1000]
+})
+
+# Create dependencies dataframe
+dependencies_data = pd.DataFrame({
+    'Activity_Code': activities_data['Activity_Code'],
+    'Prior_Activities': ['-', 'A', 'B', 'C1', 'C2', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M',
+                        'M', 'O1', 'M', 'P1', 'P2', 'N,O2,P3', 'Q1', 'Q2', 'R1', 'R2', 'Q2', 'S1', 'S2',
+                        'R3,S3', 'T1', 'T2', 'U', 'V', 'W1', 'W2', 'X']
+})
+
+# Portfolio network and CPM shared with the portfolio scheduler
+portfolio_scheduling = load_script('Portfolio Resource Scheduling.py')
+build_portfolio = portfolio_scheduling.build_portfolio
+calculate_portfolio_cpm = portfolio_scheduling.calculate_portfolio_cpm
+
+def month_boundaries(start_date, months):
+    # Day offsets of each calendar month start from start_date, plus the window end
+    month_starts = pd.date_range(pd.Timestamp(start_date).to_period('M').to_timestamp(), periods=months + 1, freq='MS')
+    days = np.asarray((month_starts - pd.Timestamp(start_date)).days, dtype=np.int64)
+    days[0] = 0
+    return month_starts[:-1], days
+
+def daily_cost_profiles(portfolio, starts, horizon, start_offsets):
+    # Spread each activity's budget evenly over its working days; one 2D difference array
+    # (project x day) for the whole portfolio
+    activities = portfolio['activities']
+    project_of = portfolio['project_of']
+    duration = np.maximum(activities['Duration'].to_numpy(dtype=np.int64), 1)
+    rate = activities['Budget_Cost'].to_numpy(dtype=np.float64) / duration
+    
+    begin = np.clip(starts[project_of] + start_offsets, 0, horizon)
+    end = np.clip(starts[project_of] + start_offsets + duration, 0, horizon)
+    delta = np.zeros((len(portfolio['project_ids']), horizon + 1))
+    np.add.at(delta, (project_of, begin), rate)
+    np.subtract.at(delta, (project_of, end), rate)
+    return np.cumsum(delta, axis=1)[:, :horizon]
+
+def forecast_cash_flow(projects, start_date, months=36, margin=0.08, retention_rate=0.05,
+                       payment_lag=1, retention_release=3, schedule='early'):
+    if schedule not in ('early', 'late'):
+        raise ValueError(f"schedule must be 'early' or 'late', not {schedule!r}")
+    if not 0 <= payment_lag <= months:
+        raise ValueError(f"payment_lag must be between 0 and {months} months")
+    portfolio = build_portfolio(projects)
+    cpm = calculate_portfolio_cpm(portfolio)
+    month_starts, boundaries = month_boundaries(start_date, months)
+    horizon = int(boundaries[-1])
+    starts = portfolio['requested_start']
+    
+    # Monthly cost per project for early- and late-start dates
+    early_daily = daily_cost_profiles(portfolio, starts, horizon, cpm['ES'])
+    late_starts = cpm['LF'] - portfolio['activities']['Duration'].to_numpy(dtype=np.int64)
+    late_daily = daily_cost_profiles(portfolio, starts, horizon, late_starts)
+    early_monthly = np.add.reduceat(early_daily, boundaries[:-1], axis=1)
+    late_monthly = np.add.reduceat(late_daily, boundaries[:-1], axis=1)
+    cost = early_monthly if schedule == 'early' else late_monthly
+    
+    # Monthly progress billing with retention withheld, paid after the payment lag
+    billing = cost * (1 + margin)
+    retention = billing * retention_rate
+    receipts = np.zeros_like(billing)
+    receipts[:, payment_lag:] = (billing - retention)[:, :months - payment_lag]
+    
+    # Retention is released a fixed number of months after each project completes
+    finish_day = starts + cpm['Project_Duration']
+    finish_month = np.searchsorted(boundaries, finish_day, side='right') - 1
+    release_month = finish_month + retention_release
+    released = np.zeros_like(billing)
+    in_window = release_month < months
+    np.add.at(released, (np.flatnonzero(in_window), release_month[in_window]), retention[in_window].sum(axis=1))
+    receipts += released
+    
+    net_cash_flow = receipts - cost
+    cash_flow = pd.DataFrame({
+        'Month': month_starts.strftime('%Y-%m'),
+        'Early_Start_Cost': early_monthly.sum(axis=0),
+        'Late_Start_Cost': late_monthly.sum(axis=0),
+        'Early_Start_Cumulative': early_monthly.sum(axis=0).cumsum(),
+        'Late_Start_Cumulative': late_monthly.sum(axis=0).cumsum(),
+        'Billing': billing.sum(axis=0),
+        'Retention_Held': retention.sum(axis=0).cumsum() - released.sum(axis=0).cumsum(),
+        'Receipts': receipts.sum(axis=0),
+        'Net_Cash_Flow': net_cash_flow.sum(axis=0),
+        'Cash_Position': net_cash_flow.sum(axis=0).cumsum()
+    })
+    project_cash = pd.DataFrame(net_cash_flow.cumsum(axis=1), index=portfolio['project_ids'],
+                                columns=month_starts.strftime('%Y-%m'))
+    
+    return {
+        'cash_flow': cash_flow,
+        'project_cash_position': project_cash,
+        'project_finish_month': pd.Series(month_starts.strftime('%Y-%m').to_numpy()[np.minimum(finish_month, months - 1)],
+                                          index=portfolio['project_ids'])
+    }
+
+# Cash flow of the sample project
+start_date = datetime(2024, 1, 1)
+single = forecast_cash_flow([{'Project': 'TAIWAN', 'activities': activities_data,
+                              'dependencies': dependencies_data, 'Start_Day': 0}],
+                            start_date, months=10)
+
+# Portfolio of 500 site projects starting over the next two years
+rng = np.random.default_rng(42)
+projects = []
+for p in range(500):
+    activities = activities_data.copy()
+    activities['Duration'] = np.maximum(1, np.round(activities['Duration'] * rng.uniform(0.8, 1.3, len(activities)))).astype(int)
+    activities['Budget_Cost'] = activities['Budget_Cost'] * rng.uniform(5, 50)
+    projects.append({
+        'Project': f'SITE{p:03d}',
+        'activities': activities,
+        'dependencies': dependencies_data,
+        'Start_Day': int(rng.integers(0, 730))
+    })
+
+start_time = time.perf_counter()
+portfolio_cash = forecast_cash_flow(projects, start_date, months=36)
+elapsed = time.perf_counter() - start_time
+
+# Print Results
+print("\nCASH FLOW FORECAST")
+print("=" * 80)
+print("Sample Project Cost S-Curves and Cash Position:")
+print("-" * 50)
+print(single['cash_flow'][['Month', 'Early_Start_Cumulative', 'Late_Start_Cumulative', 'Billing',
+                           'Receipts', 'Retention_Held', 'Cash_Position']].to_string(index=False, float_format=lambda v: f"{v:,.0f}"))
+
+print(f"\nPortfolio Forecast ({len(projects)} projects, 36 months, {elapsed:.2f} s):")
+print("-" * 50)
+cash_flow = portfolio_cash['cash_flow']
+print(cash_flow[['Month', 'Early_Start_Cost', 'Late_Start_Cost', 'Receipts', 'Net_Cash_Flow',
+                 'Cash_Position']].to_string(index=False, float_format=lambda v: f"{v:,.0f}"))
+
+lowest = cash_flow.loc[cash_flow['Cash_Position'].idxmin()]
+print(f"\nPeak Funding Need: ${-lowest['Cash_Position']:,.0f} in {lowest['Month']}")
+print(f"Largest Monthly Outflow: ${-cash_flow['Net_Cash_Flow'].min():,.0f} "
+      f"in {cash_flow.loc[cash_flow['Net_Cash_Flow'].idxmin(), 'Month']}")
@@ -0,0 +1,281 @@
+import pandas as pd
+import numpy as np
+import networkx as nx
+import json
+import os
+import shutil
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Create activities dataframe
+activities_data = pd.DataFrame({
+    'Activity_Code': ['A', 'B', 'C1', 'C2', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N',
+                     'O1', 'O2', 'P1', 'P2', 'P3', 'Q1', 'Q2', 'R1', 'R2', 'R3', 'S1', 'S2', 'S3',
+                     'T1', 'T2', 'U', 'V', 'W1', 'W2', 'X', 'Y'],
+    'Duration': [1, 8, 2, 7, 3, 7, 3, 6, 4, 3, 5, 2, 3, 9, 8,
+                 2, 2, 2, 2, 2, 22, 22, 3, 3, 3, 2, 2, 2,
+                 3, 3, 12, 12, 8, 8, 6, 1],
+    'Foremen': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+                1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 1, 1, 1,
+                1, 1, 1, 1, 1, 1, 1, 2],
+    'Workers': [2, 2, 2, 2, 2, 2, 2, 2, 3, 2, 2, 2, 2, 2, 2,
+                2, 2, 2, 2, 2, 2, 2, 3, 3, 3, 2, 2, 2,
+                2, 2, 2, 2, 2, 2, 2, 0]
+})
+
+# Create dependencies dataframe
+dependencies_data = pd.DataFrame({
+    'Activity_Code': activities_data['Activity_Code'],
+    'Prior_Activities': ['-', 'A', 'B', 'C1', 'C2', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M',
+                        'M', 'O1', 'M', 'P1', 'P2', 'N,O2,P3', 'Q1', 'Q2', 'R1', 'R2', 'Q2', 'S1', 'S2',
+                        'R3,S3', 'T1', 'T2', 'U', 'V', 'W1', 'W2', 'X']
+})
+
+def calculate_cpm(activities_df, dependencies_df):
+    G = nx.DiGraph()
+    
+    for _, row in activities_df.iterrows():
+        G.add_node(row['Activity_Code'], duration=row['Duration'])
+    
+    for _, row in dependencies_df.iterrows():
+        if pd.notna(row['Prior_Activities']) and row['Prior_Activities'] != '-':
+            predecessors = row['Prior_Activities'].split(',')
+            for pred in predecessors:
+                G.add_edge(pred.strip(), row['Activity_Code'])
+    
+    early_times = {}
+    for node in nx.topological_sort(G):
+        predecessors = list(G.predecessors(node))
+        if not predecessors:
+            early_times[node] = {'ES': 0, 'EF': G.nodes[node]['duration']}
+        else:
+            es = max(early_times[p]['EF'] for p in predecessors)
+            early_times[node] = {
+                'ES': es,
+                'EF': es + G.nodes[node]['duration']
+            }
+    
+    late_times = {}
+    project_duration = max(t['EF'] for t in early_times.values())
+    
+    for node in reversed(list(nx.topological_sort(G))):
+        successors = list(G.successors(node))
+        if not successors:
+            late_times[node] = {
+                'LF': project_duration,
+                'LS': project_duration - G.nodes[node]['duration']
+            }
+        else:
+            lf = min(late_times[s]['LS'] for s in successors)
+            late_times[node] = {
+                'LF': lf,
+                'LS': lf - G.nodes[node]['duration']
+            }
+    
+    critical_path = []
+    
+    for node in G.nodes():
+        total_float = late_times[node]['LS'] - early_times[node]['ES']
+        if total_float == 0:
+            critical_path.append(node)
+    
+    results_df = pd.DataFrame({
+        'Activity': list(G.nodes()),
+        'Duration': [G.nodes[n]['duration'] for n in G.nodes()],
+        'ES': [early_times[n]['ES'] for n in G.nodes()],
+        'EF': [early_times[n]['EF'] for n in G.nodes()],
+        'LS': [late_times[n]['LS'] for n in G.nodes()],
+        'LF': [late_times[n]['LF'] for n in G.nodes()],
+        'Total_Float': [late_times[n]['LS'] - early_times[n]['ES'] for n in G.nodes()],
+        'Critical': [n in critical_path for n in G.nodes()]
+    })
+    
+    return {
+        'project_duration': project_duration,
+        'critical_path': critical_path,
+        'results': results_df
+    }
+
+# Store layout: <store>/manifest.json plus one .npy file per column, so every column can be
+# opened with numpy.memmap (np.load(mmap_mode='r')) and only the touched pages are read.
+# Text columns are dictionary encoded: int32 codes on disk plus a small dictionary array;
+# code -1 marks a missing value.
+
+def load_manifest(store_dir):
+    path = os.path.join(store_dir, 'manifest.json')
+    if not os.path.exists(path):
+        return {'tables': {}}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def save_manifest(store_dir, manifest):
+    with open(os.path.join(store_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+def column_path(store_dir, table, column, suffix=''):
+    return os.path.join(store_dir, table, f'{column}{suffix}.npy')
+
+def write_table(store_dir, table, df):
+    table_dir = os.path.join(store_dir, table)
+    if os.path.exists(table_dir):
+        shutil.rmtree(table_dir)
+    os.makedirs(table_dir)
+    
+    columns = {}
+    for column in df.columns:
+        values = df[column]
+        if values.dtype == object or isinstance(values.dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(values):
+            codes, dictionary = pd.factorize(values)
+            np.save(column_path(store_dir, table, column), codes.astype(np.int32))
+            np.save(column_path(store_dir, table, column, '.dict'), np.asarray(dictionary, dtype=str))
+            columns[column] = {'dtype': 'int32', 'encoding': 'dictionary'}
+        else:
+            array = values.to_numpy()
+            np.save(column_path(store_dir, table, column), array)
+            columns[column] = {'dtype': str(array.dtype), 'encoding': 'plain'}
+    
+    manifest = load_manifest(store_dir)
+    manifest['tables'][table] = {'kind': 'table', 'rows': len(df), 'columns': columns}
+    save_manifest(store_dir, manifest)
+
+def open_column(store_dir, table, column):
+    # Zero-copy view of the stored column; for dictionary columns these are the int32 codes
+    return np.load(column_path(store_dir, table, column), mmap_mode='r')
+
+def read_table(store_dir, table, columns=None, rows=None):
+    # Materialize only the requested columns and row range (a slice object or index array)
+    info = load_manifest(store_dir)['tables'][table]
+    data = {}
+    for column in columns or list(info['columns']):
+        values = open_column(store_dir, table, column)
+        values = values[rows] if rows is not None else values
+        if info['columns'][column]['encoding'] == 'dictionary':
+            # Trailing None entry so the null code -1 decodes to a missing value
+            dictionary = np.load(column_path(store_dir, table, column, '.dict'))
+            values = np.append(dictionary.astype(object), None)[values]
+        data[column] = np.array(values)
+    return pd.DataFrame(data)
+
+def read_table_arrow(store_dir, table, columns=None):
+    # Optional Arrow view; numeric memmaps are wrapped without copying
+    import pyarrow as pa
+    info = load_manifest(store_dir)['tables'][table]
+    arrays = {}
+    for column in columns or list(info['columns']):
+        values = open_column(store_dir, table, column)
+        if info['columns'][column]['encoding'] == 'dictionary':
+            dictionary = pa.array(np.load(column_path(store_dir, table, column, '.dict')))
+            indices = pa.array(np.asarray(values), mask=np.asarray(values) < 0)
+            arrays[column] = pa.DictionaryArray.from_arrays(indices, dictionary)
+        else:
+            arrays[column] = pa.array(values)
+    return pa.table(arrays)
+
+def write_edges(store_dir, activity_codes, dependencies_df):
+    # Edge list as integer row positions of the activities table
+    index = pd.Index(activity_codes)
+    links = dependencies_df.assign(Predecessor=dependencies_df['Prior_Activities'].fillna('-').str.split(','))
+    links = links.explode('Predecessor')
+    links['Predecessor'] = links['Predecessor'].str.strip()
+    links = links[links['Predecessor'] != '-']
+    predecessor = index.get_indexer(links['Predecessor'])
+    successor = index.get_indexer(links['Activity_Code'])
+    unknown = sorted(set(links['Predecessor'][predecessor < 0]) | set(links['Activity_Code'][successor < 0]))
+    if unknown:
+        raise ValueError(f"Unknown activity codes in dependencies: {', '.join(map(str, unknown))}")
+    write_table(store_dir, 'edges', pd.DataFrame({
+        'Predecessor': predecessor.astype(np.int32),
+        'Successor': successor.astype(np.int32)
+    }))
+
+def write_daily_profile(store_dir, table, profiles, start_day=0):
+    # One column per resource, indexed by day offset from start_day
+    write_table(store_dir, table, pd.DataFrame(profiles))
+    manifest = load_manifest(store_dir)
+    manifest['tables'][table]['start_day'] = start_day
+    save_manifest(store_dir, manifest)
+
+def read_day_range(store_dir, table, resource, first_day, last_day):
+    start_day = load_manifest(store_dir)['tables'][table].get('start_day', 0)
+    column = open_column(store_dir, table, resource)
+    end_day = start_day + len(column) - 1
+    if first_day < start_day or last_day > end_day or first_day > last_day:
+        raise ValueError(f"Day range {first_day}-{last_day} is outside the stored days {start_day}-{end_day}")
+    return column[first_day - start_day:last_day - start_day + 1]
+
+def create_sample_matrix(store_dir, name, n_samples, activity_codes, dtype=np.float32):
+    # Column-major so each activity's samples are contiguous on disk; written in chunks
+    os.makedirs(os.path.join(store_dir, name), exist_ok=True)
+    matrix = np.lib.format.open_memmap(column_path(store_dir, name, 'samples'), mode='w+', dtype=dtype,
+                                       shape=(n_samples, len(activity_codes)), fortran_order=True)
+    np.save(column_path(store_dir, name, 'activities'), np.asarray(activity_codes, dtype=str))
+    
+    manifest = load_manifest(store_dir)
+    manifest['tables'][name] = {'kind': 'samples', 'rows': n_samples, 'activities': len(activity_codes),
+                                'dtype': np.dtype(dtype).name}
+    save_manifest(store_dir, manifest)
+    return matrix
+
+def open_sample_matrix(store_dir, name):
+    samples = np.load(column_path(store_dir, name, 'samples'), mmap_mode='r')
+    activity_codes = np.load(column_path(store_dir, name, 'activities'))
+    return samples, activity_codes
+
+def read_sample_columns(store_dir, name, codes):
+    samples, activity_codes = open_sample_matrix(store_dir, name)
+    positions = pd.Index(activity_codes).get_indexer(codes)
+    if (positions < 0).any():
+        raise KeyError(f"Unknown activity codes: {', '.join(c for c, p in zip(codes, positions) if p < 0)}")
+    return {code: samples[:, p] for code, p in zip(codes, positions)}
+
+if __name__ == '__main__':
+    store_dir = os.path.join(SCRIPT_DIR, 'schedule-store')
+    os.makedirs(store_dir, exist_ok=True)
+    
+    # Write activities, links and CPM results
+    cpm_results = calculate_cpm(activities_data, dependencies_data)
+    write_table(store_dir, 'activities', activities_data)
+    write_edges(store_dir, activities_data['Activity_Code'], dependencies_data)
+    write_table(store_dir, 'cpm_results', cpm_results['results'])
+    
+    # Daily resource profile from ES/EF with difference arrays
+    results = cpm_results['results'].merge(activities_data[['Activity_Code', 'Foremen', 'Workers']],
+                                           left_on='Activity', right_on='Activity_Code')
+    profiles = {}
+    for resource in ['Foremen', 'Workers']:
+        delta = np.zeros(cpm_results['project_duration'] + 1)
+        np.add.at(delta, results['ES'].to_numpy(), results[resource].to_numpy())
+        np.subtract.at(delta, results['EF'].to_numpy(), results[resource].to_numpy())
+        profiles[resource] = np.cumsum(delta)
+    write_daily_profile(store_dir, 'daily_resources', profiles)
+    
+    # Stream 100k triangular duration samples to disk in chunks without holding them in RAM
+    n_samples, chunk_size = 100_000, 10_000
+    rng = np.random.default_rng(42)
+    duration = activities_data['Duration'].to_numpy(dtype=np.float64)
+    samples = create_sample_matrix(store_dir, 'duration_samples', n_samples, activities_data['Activity_Code'])
+    for start in range(0, n_samples, chunk_size):
+        stop = min(start + chunk_size, n_samples)
+        samples[start:stop] = rng.triangular(duration * 0.8, duration, duration * 1.4, size=(stop - start, len(duration)))
+    samples.flush()
+    del samples
+    
+    # Read back only what is needed
+    critical = read_table(store_dir, 'cpm_results', columns=['Activity', 'Total_Float'])
+    week_foremen = read_day_range(store_dir, 'daily_resources', 'Foremen', 63, 69)
+    roof_samples = read_sample_columns(store_dir, 'duration_samples', ['Q1', 'Q2'])
+    
+    # Print Results
+    print("\nCOLUMNAR SCHEDULE STORE")
+    print("=" * 80)
+    print(f"Store: {store_dir}")
+    for table, info in load_manifest(store_dir)['tables'].items():
+        print(f"  {table}: {info['rows']} rows ({info['kind']})")
+    
+    print("\nPartial Reads:")
+    print("-" * 50)
+    print(f"Activities with float: {', '.join(critical.loc[critical['Total_Float'] > 0, 'Activity'])}")
+    print(f"Foremen on days 63-69: {week_foremen.tolist()}")
+    for code, column in roof_samples.items():
+        print(f"{code} samples: mean {column.mean():.2f} days, P90 {np.percentile(column, 90):.2f} days "
+              f"(memory-mapped, {column.nbytes / 2**20:.1f} MB column)")
@@ -0,0 +1,249 @@
+import pandas as pd
+import numpy as np
+import argparse
+import json
+import os
+import tempfile
+import time
+from scipy import stats
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Create PERT dataframe with hand-entered time estimates
+pert_data = pd.DataFrame({
+    'Activity_Code': ['A', 'B', 'C1', 'C2', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N',
+                     'O1', 'O2', 'P1', 'P2', 'P3', 'Q1', 'Q2', 'R1', 'R2', 'R3', 'S1', 'S2', 'S3',
+                     'T1', 'T2', 'U', 'V', 'W1', 'W2', 'X', 'Y'],
+    'Optimistic': [1, 6, 1, 5, 2, 5, 2, 4, 3, 2, 4, 1, 2, 7, 6,
+                   1, 1, 1, 1, 1, 18, 18, 2, 2, 2, 1, 1, 1,
+                   2, 2, 9, 9, 6, 6, 4, 1],
+    'Most_Likely': [1, 8, 2, 7, 3, 7, 3, 6, 4, 3, 5, 2, 3, 9, 8,
+                    2, 2, 2, 2, 2, 22, 22, 3, 3, 3, 2, 2, 2,
+                    3, 3, 12, 12, 8, 8, 6, 1],
+    'Pessimistic': [2, 12, 4, 10, 5, 10, 5, 9, 6, 5, 7, 4, 5, 12, 11,
+                    4, 4, 4, 4, 4, 28, 28, 5, 5, 5, 4, 4, 4,
+                    5, 5, 16, 16, 11, 11, 9, 2]
+})
+
+# Work type of each activity in taiwan-construction-data.txt
+activity_work_types = {
+    'A': 'Formwork_Installation',
+    'B': 'Site_Preparation',
+    'C1': 'Foundation_Testing',
+    'C2': 'Foundation_Backfill',
+    'D': 'Waterproofing_Base',
+    'E': 'Sand_Base',
+    'F': 'Stone_Foundation',
+    'G': 'RC_Foundation',
+    'H': 'MEP_Rough_In',
+    'I': 'Ground_Beam',
+    'J': 'Column_Construction',
+    'K': 'Structural_Testing',
+    'L': 'Ring_Beam',
+    'M': 'Block_Wall',
+    'N': 'Wall_Finishing',
+    'O1': 'Door_Frame_A',
+    'O2': 'Door_Frame_B',
+    'P1': 'Window_Type_A',
+    'P2': 'Window_Type_B',
+    'P3': 'Glass_Installation',
+    'Q1': 'Steel_Roof',
+    'Q2': 'Roof_Covering',
+    'R1': 'LED_Installation',
+    'R2': 'Switch_Installation',
+    'R3': 'Socket_Installation',
+    'S1': 'Plumbing_Fixtures',
+    'S2': 'Water_Supply',
+    'S3': 'Drainage_System',
+    'T1': 'Ceiling_Frame',
+    'T2': 'Ceiling_Panel',
+    'U': 'Floor_Tiling',
+    'V': 'Skirting',
+    'W1': 'Interior_Painting',
+    'W2': 'Exterior_Painting',
+    'X': 'Landscaping',
+    'Y': 'Quality_Inspection'
+}
+
+# Normal-Inverse-Gamma prior on log(actual / planned duration): centred on the plan
+# with roughly +/-20% spread, worth a couple of observations
+PRIOR = {'mu': 0.0, 'kappa': 2.0, 'alpha': 3.0, 'beta': 0.08}
+
+# Posterior predictive quantiles used as optimistic / pessimistic multipliers
+LOW_QUANTILE = 0.05
+HIGH_QUANTILE = 0.95
+
+def load_work_types(path, activity_codes, work_types=activity_work_types):
+    # Activities map to work types by code; every mapped work type must exist in the productivity data
+    known = set(pd.read_csv(path)['Work'])
+    missing = [code for code in activity_codes if code not in work_types]
+    if missing:
+        raise KeyError(f"No work type for activities: {', '.join(missing)}")
+    works = [work_types[code] for code in activity_codes]
+    unknown = sorted(set(works) - known)
+    if unknown:
+        raise ValueError(f"Work types not in {os.path.basename(path)}: {', '.join(unknown)}")
+    return pd.DataFrame({'Activity_Code': list(activity_codes), 'Work': works})
+
+def summarize_actuals(actuals_df):
+    # Sufficient statistics per work type: count, sum and sum of squares of the log ratio
+    x = np.log(actuals_df['Actual_Duration'].to_numpy(dtype=np.float64) /
+               actuals_df['Planned_Duration'].to_numpy(dtype=np.float64))
+    codes, works = pd.factorize(actuals_df['Work'])
+    return pd.DataFrame({
+        'Observations': np.bincount(codes, minlength=len(works)),
+        'Sum': np.bincount(codes, weights=x, minlength=len(works)),
+        'Sum_Squares': np.bincount(codes, weights=x * x, minlength=len(works))
+    }, index=pd.Index(works, name='Work'))
+
+def fit_parameters(summary, prior):
+    # Conjugate update, vectorized over work types
+    n = summary['Observations'].to_numpy(dtype=np.float64)
+    mean = np.divide(summary['Sum'].to_numpy(), n, out=np.zeros(len(n)), where=n > 0)
+    squares = summary['Sum_Squares'].to_numpy() - n * mean ** 2
+    
+    kappa = prior['kappa'] + n
+    mu = (prior['kappa'] * prior['mu'] + n * mean) / kappa
+    alpha = prior['alpha'] + n / 2
+    beta = prior['beta'] + squares / 2 + prior['kappa'] * n * (mean - prior['mu']) ** 2 / (2 * kappa)
+    
+    # Posterior predictive of the log ratio is Student-t
+    dof = 2 * alpha
+    scale = np.sqrt(beta * (kappa + 1) / (alpha * kappa))
+    return pd.DataFrame({
+        'Observations': n.astype(np.int64),
+        'Mu': mu,
+        'Kappa': kappa,
+        'Alpha': alpha,
+        'Beta': beta,
+        'Low_Ratio': np.exp(mu + scale * stats.t.ppf(LOW_QUANTILE, dof)),
+        'Median_Ratio': np.exp(mu),
+        'High_Ratio': np.exp(mu + scale * stats.t.ppf(HIGH_QUANTILE, dof))
+    }, index=summary.index)
+
+def create_calibration(actuals_df, prior=PRIOR):
+    summary = summarize_actuals(actuals_df)
+    return {
+        'prior': prior,
+        'summary': summary,
+        'parameters': fit_parameters(summary, prior),
+        'version': 1
+    }
+
+def update_calibration(calibration, completed_df):
+    # Completed projects add to the sufficient statistics; only their work types are refitted
+    new_summary = summarize_actuals(completed_df)
+    summary = calibration['summary'].add(new_summary, fill_value=0)
+    summary['Observations'] = summary['Observations'].astype(np.int64)
+    refit = fit_parameters(summary.loc[new_summary.index], calibration['prior'])
+    parameters = calibration['parameters'].reindex(summary.index)
+    parameters.loc[refit.index] = refit
+    parameters['Observations'] = parameters['Observations'].astype(np.int64)
+    
+    calibration['summary'] = summary
+    calibration['parameters'] = parameters
+    calibration['version'] += 1
+    return calibration
+
+def save_calibration(calibration, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'prior': calibration['prior'],
+            'version': calibration['version'],
+            'summary': calibration['summary'].reset_index().to_dict('records'),
+            'parameters': calibration['parameters'].reset_index().to_dict('records')
+        }, f, indent=1)
+
+def load_calibration(path):
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return {
+        'prior': data['prior'],
+        'summary': pd.DataFrame(data['summary']).set_index('Work'),
+        'parameters': pd.DataFrame(data['parameters']).set_index('Work'),
+        'version': data['version']
+    }
+
+def estimate_pert(calibration, activities_df):
+    # Lookup only: planned durations scaled by the cached multipliers of each work type;
+    # work types with no history fall back to the prior
+    prior_ratios = fit_parameters(pd.DataFrame({'Observations': [0], 'Sum': [0.0], 'Sum_Squares': [0.0]}),
+                                  calibration['prior']).iloc[0]
+    ratios = calibration['parameters'].reindex(activities_df['Work'])[['Low_Ratio', 'Median_Ratio', 'High_Ratio']]
+    ratios = ratios.fillna(prior_ratios[['Low_Ratio', 'Median_Ratio', 'High_Ratio']]).to_numpy()
+    planned = activities_df['Planned_Duration'].to_numpy(dtype=np.float64)[:, None]
+    estimates = np.round(planned * ratios, 1)
+    
+    result = pd.DataFrame({
+        'Activity_Code': activities_df['Activity_Code'].to_numpy(),
+        'Work': activities_df['Work'].to_numpy(),
+        'Optimistic': estimates[:, 0],
+        'Most_Likely': estimates[:, 1],
+        'Pessimistic': estimates[:, 2]
+    })
+    result['Expected_Time'] = (result['Optimistic'] + 4*result['Most_Likely'] + result['Pessimistic'])/6
+    return result
+
+def generate_historical_actuals(work_types, n_records, seed=42):
+    # Stand-in for the company's actuals table: each work type has its own typical
+    # overrun and spread, and planned durations vary by project
+    rng = np.random.default_rng(seed)
+    works = np.asarray(work_types)
+    bias = rng.normal(0.05, 0.08, len(works))
+    spread = rng.uniform(0.05, 0.3, len(works))
+    work = rng.integers(0, len(works), n_records)
+    planned = rng.integers(1, 30, n_records)
+    actual = np.maximum(1, np.round(planned * np.exp(rng.normal(bias[work], spread[work]))))
+    return pd.DataFrame({'Work': works[work], 'Planned_Duration': planned, 'Actual_Duration': actual})
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Calibrate PERT estimates from historical actuals')
+    parser.add_argument('--cache', default=os.path.join(tempfile.gettempdir(), 'pert-calibration.json'),
+                        help='where the fitted parameters are cached')
+    args = parser.parse_args()
+    
+    # Work types of the sample project and its planned (most likely) durations
+    work_types = load_work_types(os.path.join(SCRIPT_DIR, 'taiwan-construction-data.txt'), pert_data['Activity_Code'])
+    project_activities = work_types.assign(Planned_Duration=pert_data['Most_Likely'])
+    
+    # Fit once from years of actuals and cache the parameters
+    actuals = generate_historical_actuals(work_types['Work'], 1_000_036)
+    historical_actuals, completed_project = actuals.iloc[:-36], actuals.iloc[-36:]
+    start_time = time.perf_counter()
+    calibration = create_calibration(historical_actuals)
+    fit_seconds = time.perf_counter() - start_time
+    cache_path = args.cache
+    save_calibration(calibration, cache_path)
+    
+    # A project completes: fold its actuals into the priors
+    start_time = time.perf_counter()
+    calibration = update_calibration(load_calibration(cache_path), completed_project)
+    update_seconds = time.perf_counter() - start_time
+    save_calibration(calibration, cache_path)
+    
+    # New estimates by lookup
+    start_time = time.perf_counter()
+    calibrated = estimate_pert(calibration, project_activities)
+    estimate_seconds = time.perf_counter() - start_time
+    
+    # Print Results
+    print("\nPERT CALIBRATION FROM HISTORICAL ACTUALS")
+    print("=" * 80)
+    print(f"Historical Records: {len(historical_actuals):,} across {historical_actuals['Work'].nunique()} work types")
+    print(f"Initial Fit: {fit_seconds:.2f} s")
+    print(f"Update with {len(completed_project)} completed activities: {update_seconds * 1000:.1f} ms")
+    print(f"Estimate by Lookup ({len(calibrated)} activities): {estimate_seconds * 1000:.1f} ms")
+    print(f"Cached Parameters: {cache_path} (version {calibration['version']})")
+    
+    print("\nCalibrated vs. Hand-Entered Estimates:")
+    print("-" * 50)
+    comparison = calibrated.merge(pert_data, on='Activity_Code', suffixes=('', '_Manual'))
+    print(comparison[['Activity_Code', 'Work', 'Optimistic', 'Most_Likely', 'Pessimistic',
+                      'Optimistic_Manual', 'Most_Likely_Manual', 'Pessimistic_Manual']].to_string(index=False))
+    
+    print("\nWork Types with the Largest Typical Overrun:")
+    print("-" * 50)
+    overrun = calibration['parameters'].sort_values('Median_Ratio', ascending=False).head(5)
+    for work, row in overrun.iterrows():
+        print(f"{work}: median {(row['Median_Ratio'] - 1) * 100:+.1f}%, "
+              f"90% range {row['Low_Ratio']:.2f}x - {row['High_Ratio']:.2f}x ({int(row['Observations']):,} records)")
@@ -0,0 +1,298 @@
+import pandas as pd
+import numpy as np
+import time
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Create activities dataframe for the sample project
+activities_data = pd.DataFrame({
+    'Activity_Code': ['A', 'B', 'C1', 'C2', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N',
+                     'O1', 'O2', 'P1', 'P2', 'P3', 'Q1', 'Q2', 'R1', 'R2', 'R3', 'S1', 'S2', 'S3',
+                     'T1', 'T2', 'U', 'V', 'W1', 'W2', 'X', 'Y'],
+    'Duration': [1, 8, 2, 7, 3, 7, 3, 6, 4, 3, 5, 2, 3, 9, 8,
+                 2, 2, 2, 2, 2, 22, 22, 3, 3, 3, 2, 2, 2,
+                 3, 3, 12, 12, 8, 8, 6, 1],
+    'Foremen': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+                1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 1, 1, 1,
+                1, 1, 1, 1, 1, 1, 1, 2],
+    'Workers': [2, 2, 2, 2, 2, 2, 2, 2, 3, 2, 2, 2, 2, 2, 2,
+                2, 2, 2, 2, 2, 2, 2, 3, 3, 3, 2, 2, 2,
+                2, 2, 2, 2, 2, 2, 2, 0]
+})
+
+# Create dependencies dataframe
+dependencies_data = pd.DataFrame({
+    'Activity_Code': activities_data['Activity_Code'],
+    'Prior_Activities': ['-', 'A', 'B', 'C1', 'C2', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M',
+                        'M', 'O1', 'M', 'P1', 'P2', 'N,O2,P3', 'Q1', 'Q2', 'R1', 'R2', 'Q2', 'S1', 'S2',
+                        'R3,S3', 'T1', 'T2', 'U', 'V', 'W1', 'W2', 'X']
+})
+
+RESOURCES = ['Foremen', 'Workers']
+
+def build_portfolio(projects):
+    # Stack every project's activities and links into one network with global row positions
+    activities = pd.concat(
+        [p['activities'].assign(Project=p['Project']) for p in projects], ignore_index=True)
+    dependencies = pd.concat(
+        [p['dependencies'].assign(Project=p['Project']) for p in projects], ignore_index=True)
+    
+    links = dependencies.assign(Predecessor=dependencies['Prior_Activities'].fillna('-').str.split(','))
+    links = links.explode('Predecessor')
+    links['Predecessor'] = links['Predecessor'].str.strip()
+    links = links[links['Predecessor'] != '-']
+    
+    index = pd.MultiIndex.from_frame(activities[['Project', 'Activity_Code']])
+    pred = index.get_indexer(pd.MultiIndex.from_frame(links[['Project', 'Predecessor']]))
+    succ = index.get_indexer(pd.MultiIndex.from_frame(links[['Project', 'Activity_Code']]))
+    # -1 would silently link to the last activity of the whole portfolio
+    unknown = links[(pred < 0) | (succ < 0)]
+    if len(unknown):
+        raise ValueError("Links to unknown activities: " + ', '.join(
+            f"{row.Predecessor} -> {row.Activity_Code} ({row.Project})" for row in unknown.itertuples()))
+    
+    project_ids = pd.Index([p['Project'] for p in projects])
+    return {
+        'activities': activities,
+        'project_ids': project_ids,
+        'project_of': project_ids.get_indexer(activities['Project']),
+        'requested_start': np.array([p['Start_Day'] for p in projects], dtype=np.int64),
+        'pred': pred,
+        'succ': succ
+    }
+
+def calculate_portfolio_cpm(portfolio):
+    # Longest-path relaxation over all projects' links at once; converges in at most
+    # (deepest project's path length) sweeps instead of one topological pass per project
+    duration = portfolio['activities']['Duration'].to_numpy(dtype=np.int64)
+    pred, succ = portfolio['pred'], portfolio['succ']
+    n = len(duration)
+    
+    es = np.zeros(n, dtype=np.int64)
+    # A longest path has fewer links than activities, so more sweeps than that mean a cycle
+    for _ in range(n + 1):
+        new_es = es.copy()
+        np.maximum.at(new_es, succ, es[pred] + duration[pred])
+        if np.array_equal(new_es, es):
+            break
+        es = new_es
+    else:
+        raise ValueError("Dependency cycle in the portfolio network")
+    ef = es + duration
+    
+    # Late dates against each project's own finish
+    project_finish = np.zeros(len(portfolio['project_ids']), dtype=np.int64)
+    np.maximum.at(project_finish, portfolio['project_of'], ef)
+    lf = project_finish[portfolio['project_of']]
+    for _ in range(n + 1):
+        new_lf = lf.copy()
+        np.minimum.at(new_lf, pred, lf[succ] - duration[succ])
+        if np.array_equal(new_lf, lf):
+            break
+        lf = new_lf
+    else:
+        raise ValueError("Dependency cycle in the portfolio network")
+    
+    min_succ_es = project_finish[portfolio['project_of']].copy()
+    np.minimum.at(min_succ_es, pred, es[succ])
+    
+    return {
+        'ES': es,
+        'EF': ef,
+        'LF': lf,
+        'Total_Float': lf - ef,
+        'Free_Float': min_succ_es - ef,
+        'Project_Duration': project_finish
+    }
+
+def build_project_profiles(portfolio, cpm, starts, horizon):
+    # Per-project daily demand from one 2D difference array: projects x days, per resource
+    n_projects = len(portfolio['project_ids'])
+    project_of = portfolio['project_of']
+    profiles = {}
+    for resource in RESOURCES:
+        amount = portfolio['activities'][resource].to_numpy(dtype=np.float64)
+        delta = np.zeros((n_projects, horizon + 1))
+        np.add.at(delta, (project_of, np.minimum(starts, horizon)), amount)
+        np.subtract.at(delta, (project_of, np.minimum(starts + portfolio['activities']['Duration'].to_numpy(), horizon)),
+                       amount)
+        profiles[resource] = np.cumsum(delta, axis=1)[:, :horizon]
+    return profiles
+
+def find_overallocations(profiles, pool_limits, portfolio):
+    records = []
+    for resource in RESOURCES:
+        total = profiles[resource].sum(axis=0)
+        over_days = np.flatnonzero(total > pool_limits[resource])
+        for day in over_days:
+            contributors = np.flatnonzero(profiles[resource][:, day] > 0)
+            records.append({
+                'Resource': resource,
+                'Day': day,
+                'Demand': total[day],
+                'Limit': pool_limits[resource],
+                'Projects': len(contributors)
+            })
+    return pd.DataFrame(records, columns=['Resource', 'Day', 'Demand', 'Limit', 'Projects'])
+
+def stagger_project_starts(portfolio, cpm, pool_limits, horizon, max_delay):
+    # Greedy placement in requested-start order: each project starts at the earliest offset
+    # (up to max_delay days late) that adds the least over-allocation to the pools,
+    # which is the first offset where its whole profile fits whenever one exists
+    n_projects = len(portfolio['project_ids'])
+    late = np.flatnonzero((portfolio['requested_start'] < 0) | (portfolio['requested_start'] > horizon))
+    if len(late):
+        raise ValueError(f"Requested start outside the 0-{horizon} day horizon: "
+                         f"{', '.join(map(str, portfolio['project_ids'][late]))}")
+    zero_starts = cpm['ES']
+    base_profiles = build_project_profiles(portfolio, cpm, zero_starts, horizon)
+    length = int(cpm['Project_Duration'].max())
+    usage = {resource: np.zeros(horizon + max_delay + length) for resource in RESOURCES}
+    offsets = np.zeros(n_projects, dtype=np.int64)
+    
+    for p in np.argsort(portfolio['requested_start'], kind='stable'):
+        requested = portfolio['requested_start'][p]
+        excess = np.zeros(max_delay + 1)
+        for resource in RESOURCES:
+            profile = base_profiles[resource][p, :length]
+            window = usage[resource][requested:requested + max_delay + length]
+            windows = sliding_window_view(window, length)[:max_delay + 1]
+            limit = pool_limits[resource]
+            # Only the over-allocation this project adds counts against an offset
+            excess += (np.maximum(windows + profile - limit, 0) - np.maximum(windows - limit, 0)).sum(axis=1)
+        delay = int(np.argmin(excess))
+        offsets[p] = requested + delay
+        for resource in RESOURCES:
+            usage[resource][offsets[p]:offsets[p] + length] += base_profiles[resource][p, :length]
+    
+    return offsets
+
+def shift_noncritical_activities(portfolio, cpm, starts, pool_limits, horizon):
+    # Move activities later within their free float while that lowers an overloaded day;
+    # staying inside free float never disturbs successors or project finish dates
+    starts = starts.copy()
+    duration = portfolio['activities']['Duration'].to_numpy(dtype=np.int64)
+    amounts = {resource: portfolio['activities'][resource].to_numpy(dtype=np.float64) for resource in RESOURCES}
+    profiles = build_project_profiles(portfolio, cpm, starts, horizon)
+    totals = {resource: profiles[resource].sum(axis=0) for resource in RESOURCES}
+    
+    over = np.zeros(horizon, dtype=bool)
+    for resource in RESOURCES:
+        over |= totals[resource] > pool_limits[resource]
+    over_prefix = np.concatenate([[0], np.cumsum(over)])
+    touches_overload = over_prefix[np.minimum(starts + duration, horizon)] > over_prefix[np.minimum(starts, horizon)]
+    candidates = np.flatnonzero(touches_overload & (cpm['Free_Float'] > 0))
+    
+    # Largest free float first: those activities have the most room to move
+    for i in candidates[np.argsort(-cpm['Free_Float'][candidates], kind='stable')]:
+        s, d = starts[i], duration[i]
+        end = min(s + cpm['Free_Float'][i] + d, horizon)
+        best_shift, best_excess = 0, None
+        for shift in range(end - s - d + 1):
+            excess = 0.0
+            for resource in RESOURCES:
+                day_totals = totals[resource].copy()
+                day_totals[s:s + d] -= amounts[resource][i]
+                day_totals[s + shift:s + shift + d] += amounts[resource][i]
+                excess += np.maximum(day_totals[s:end] - pool_limits[resource], 0).sum()
+            if best_excess is None or excess < best_excess:
+                best_shift, best_excess = shift, excess
+        if best_shift:
+            for resource in RESOURCES:
+                totals[resource][s:s + d] -= amounts[resource][i]
+                totals[resource][s + best_shift:s + best_shift + d] += amounts[resource][i]
+            starts[i] = s + best_shift
+    
+    return starts
+
+def schedule_portfolio(projects, pool_limits, horizon, max_delay=90):
+    portfolio = build_portfolio(projects)
+    cpm = calculate_portfolio_cpm(portfolio)
+    project_of = portfolio['project_of']
+    
+    requested_starts = portfolio['requested_start'][project_of] + cpm['ES']
+    before = build_project_profiles(portfolio, cpm, requested_starts, horizon)
+    
+    offsets = stagger_project_starts(portfolio, cpm, pool_limits, horizon, max_delay)
+    starts = shift_noncritical_activities(portfolio, cpm, offsets[project_of] + cpm['ES'], pool_limits, horizon)
+    after = build_project_profiles(portfolio, cpm, starts, horizon)
+    
+    schedule = portfolio['activities'][['Project', 'Activity_Code', 'Duration'] + RESOURCES].copy()
+    schedule['Start'] = starts
+    schedule['Finish'] = starts + schedule['Duration']
+    schedule['Shift'] = starts - (offsets[project_of] + cpm['ES'])
+    
+    return {
+        'schedule': schedule,
+        'project_starts': pd.DataFrame({
+            'Project': portfolio['project_ids'],
+            'Requested_Start': portfolio['requested_start'],
+            'Scheduled_Start': offsets,
+            'Delay': offsets - portfolio['requested_start']
+        }),
+        'overallocation_before': find_overallocations(before, pool_limits, portfolio),
+        'overallocation_after': find_overallocations(after, pool_limits, portfolio),
+        'peak_before': {resource: before[resource].sum(axis=0).max() for resource in RESOURCES},
+        'peak_after': {resource: after[resource].sum(axis=0).max() for resource in RESOURCES},
+        'excess_before': {resource: np.maximum(before[resource].sum(axis=0) - pool_limits[resource], 0).sum()
+                          for resource in RESOURCES},
+        'excess_after': {resource: np.maximum(after[resource].sum(axis=0) - pool_limits[resource], 0).sum()
+                         for resource in RESOURCES}
+    }
+
+# Build a portfolio of 500 site projects based on the sample project, with varied
+# durations and crews and requested starts spread over two years
+rng = np.random.default_rng(42)
+projects = []
+for p in range(500):
+    activities = activities_data.copy()
+    activities['Duration'] = np.maximum(1, np.round(activities['Duration'] * rng.uniform(0.8, 1.3, len(activities)))).astype(int)
+    activities['Workers'] = activities['Workers'] + rng.integers(0, 2, len(activities))
+    projects.append({
+        'Project': f'SITE{p:03d}',
+        'activities': activities,
+        'dependencies': dependencies_data,
+        'Start_Day': int(rng.integers(0, 730))
+    })
+
+pool_limits = {'Foremen': 120, 'Workers': 330}
+horizon = 730 + 90 + 250
+
+start_time = time.perf_counter()
+portfolio_results = schedule_portfolio(projects, pool_limits, horizon)
+elapsed = time.perf_counter() - start_time
+
+# Print Results
+print("\nPORTFOLIO RESOURCE SCHEDULING RESULTS")
+print("=" * 80)
+print(f"Projects: {len(projects)}")
+print(f"Activities: {len(portfolio_results['schedule'])}")
+print(f"Shared Pools: {pool_limits['Foremen']} foremen, {pool_limits['Workers']} workers")
+print(f"Scheduling Time: {elapsed:.2f} s")
+
+print("\nPeak Portfolio Demand:")
+print("-" * 50)
+for resource in RESOURCES:
+    print(f"{resource}: {portfolio_results['peak_before'][resource]:.0f} requested -> "
+          f"{portfolio_results['peak_after'][resource]:.0f} scheduled (limit {pool_limits[resource]})")
+
+print("\nOver-Allocation (crew-days above pool limit):")
+print("-" * 50)
+for resource in RESOURCES:
+    print(f"{resource}: {portfolio_results['excess_before'][resource]:.0f} requested -> "
+          f"{portfolio_results['excess_after'][resource]:.0f} scheduled")
+
+print("\nOver-Allocated Days:")
+print("-" * 50)
+print(f"Before leveling: {len(portfolio_results['overallocation_before'])}")
+print(f"After leveling: {len(portfolio_results['overallocation_after'])}")
+if not portfolio_results['overallocation_after'].empty:
+    print(portfolio_results['overallocation_after'].head(10).to_string(index=False))
+
+print("\nDelayed Project Starts:")
+print("-" * 50)
+delayed = portfolio_results['project_starts'][portfolio_results['project_starts']['Delay'] > 0]
+print(f"{len(delayed)} of {len(projects)} projects delayed, mean delay {delayed['Delay'].mean() if len(delayed) else 0:.1f} days")
+print(delayed.sort_values('Delay', ascending=False).head(10).to_string(index=False))
+
+shifted = portfolio_results['schedule'][portfolio_results['schedule']['Shift'] > 0]
+print(f"\nNon-critical activities shifted within free float: {len(shifted)}")
@@ -0,0 +1,272 @@
+import pandas as pd
+import numpy as np
+import networkx as nx
+import argparse
+import heapq
+import json
+import math
+import queue
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+# Create activities dataframe with cost and progress data
+activities_data = pd.DataFrame({
+    'Activity_Code': ['A', 'B', 'C1', 'C2', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N',
+                     'O1', 'O2', 'P1', 'P2', 'P3', 'Q1', 'Q2', 'R1', 'R2', 'R3', 'S1', 'S2', 'S3',
+                     'T1', 'T2', 'U', 'V', 'W1', 'W2', 'X', 'Y'],
+    'Duration': [1, 8, 2, 7, 3, 7, 3, 6, 4, 3, 5, 2, 3, 9, 8,
+                 2, 2, 2, 2, 2, 22, 22, 3, 3, 3, 2, 2, 2,
+                 3, 3, 12, 12, 8, 8, 6, 1],
+    'Budget_Cost': [1000, 8000, 2000, 7000, 3000, 7000, 3000, 6000, 4000, 3000, 5000, 2000, 3000,
+                    9000, 8000, 2000, 2000, 2000, 2000, 2000, 22000, 22000, 3000, 3000, 3000,
+                    2000, 2000, 2000, 3000, 3000, 12000, 12000, 8000, 8000, 6000, 1000],
+    'Actual_Cost': [1200, 7800, 2200, 7500, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+                    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+                    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+    'Percent_Complete': [100, 100, 100, 100, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+                        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+                        0, 0, 0, 0, 0, 0, 0, 0]
+})
+
+# Create dependencies dataframe
+dependencies_data = pd.DataFrame({
+    'Activity_Code': activities_data['Activity_Code'],
+    'Prior_Activities': ['-', 'A', 'B', 'C1', 'C2', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M',
+                        'M', 'O1', 'M', 'P1', 'P2', 'N,O2,P3', 'Q1', 'Q2', 'R1', 'R2', 'Q2', 'S1', 'S2',
+                        'R3,S3', 'T1', 'T2', 'U', 'V', 'W1', 'W2', 'X']
+})
+
+def build_progress_state(activities_df, dependencies_df, start_date):
+    G = nx.DiGraph()
+    G.add_nodes_from(activities_df['Activity_Code'])
+    for _, row in dependencies_df.iterrows():
+        if pd.notna(row['Prior_Activities']) and row['Prior_Activities'] != '-':
+            predecessors = row['Prior_Activities'].split(',')
+            for pred in predecessors:
+                G.add_edge(pred.strip(), row['Activity_Code'])
+    
+    codes = list(activities_df['Activity_Code'])
+    index = {code: i for i, code in enumerate(codes)}
+    order = np.array([index[n] for n in nx.topological_sort(G)])
+    position = np.empty(len(codes), dtype=np.int64)
+    position[order] = np.arange(len(codes))
+    
+    budget = activities_df['Budget_Cost'].to_numpy(dtype=np.float64)
+    percent = activities_df['Percent_Complete'].to_numpy(dtype=np.float64)
+    # Same actual cost convention as perform_earned_value_analysis
+    actual = activities_df['Actual_Cost'].to_numpy(dtype=np.float64) * percent / 100
+    
+    state = {
+        'codes': codes,
+        'index': index,
+        'order': order,
+        'position': position,
+        'predecessors': [np.array([index[p] for p in G.predecessors(c)], dtype=np.int64) for c in codes],
+        'successors': [[index[s] for s in G.successors(c)] for c in codes],
+        'start_date': start_date,
+        'duration': activities_df['Duration'].to_numpy(dtype=np.int64),
+        'budget': budget,
+        'percent': percent,
+        'actual': actual,
+        # Day of the first and latest progress report; -1 until the activity reports
+        'actual_start': np.full(len(codes), -1, dtype=np.int64),
+        'reported_day': np.full(len(codes), -1, dtype=np.int64),
+        'remaining': activities_df['Duration'].to_numpy(dtype=np.int64) * (100 - percent) / 100,
+        'BAC': budget.sum(),
+        'EV': float((budget * percent / 100).sum()),
+        'AC': float(actual.sum())
+    }
+    
+    # Full forward pass once; every event afterwards only touches the affected subgraph
+    es = np.zeros(len(codes), dtype=np.int64)
+    ef = np.zeros(len(codes), dtype=np.int64)
+    for i in order:
+        es[i], ef[i] = forecast_activity(state, ef, i)
+    state['es'], state['ef'] = es, ef
+    state['finish_heap'] = [(-ef[i], i) for i in range(len(codes))]
+    heapq.heapify(state['finish_heap'])
+    return state
+
+def forecast_activity(state, ef, i):
+    # Reported activities are anchored on their status date; the rest follow the logic
+    if state['reported_day'][i] >= 0:
+        return state['actual_start'][i], state['reported_day'][i] + math.ceil(state['remaining'][i])
+    preds = state['predecessors'][i]
+    es = ef[preds].max() if len(preds) else 0
+    return es, es + state['duration'][i]
+
+def update_forecast(state, changed):
+    # Re-time only the descendants whose dates actually move, in topological order
+    es, ef = state['es'], state['ef']
+    heap = [state['position'][changed]]
+    queued = {changed}
+    touched = 0
+    while heap:
+        i = state['order'][heapq.heappop(heap)]
+        new_es, new_ef = forecast_activity(state, ef, i)
+        touched += 1
+        if i != changed and new_es == es[i] and new_ef == ef[i]:
+            continue
+        es[i], ef[i] = new_es, new_ef
+        heapq.heappush(state['finish_heap'], (-new_ef, i))
+        for s in state['successors'][i]:
+            if s not in queued:
+                queued.add(s)
+                heapq.heappush(heap, state['position'][s])
+    return touched
+
+def forecast_finish(state):
+    # Lazy max-heap: drop entries whose activity finish has since changed
+    heap = state['finish_heap']
+    while -heap[0][0] != state['ef'][heap[0][1]]:
+        heapq.heappop(heap)
+    return int(-heap[0][0])
+
+def parse_event(state, event):
+    # Raises KeyError/TypeError/ValueError for malformed events before any state changes
+    if not isinstance(event, dict):
+        raise TypeError(f"event must be an object, got {type(event).__name__}")
+    if event.get('Activity_Code') not in state['index']:
+        raise KeyError(f"unknown activity {event.get('Activity_Code')!r}")
+    date = event['Date']
+    if isinstance(date, str):
+        date = datetime.fromisoformat(date)
+    percent = float(event['Percent_Complete'])
+    cost = event.get('Actual_Cost')
+    cost = float(cost) if cost is not None else None
+    if not math.isfinite(percent) or (cost is not None and not math.isfinite(cost)):
+        raise ValueError("Percent_Complete and Actual_Cost must be finite numbers")
+    return {
+        'i': state['index'][event['Activity_Code']],
+        'day': (date - state['start_date']).days,
+        'percent': percent,
+        'cost': cost
+    }
+
+def apply_progress_event(state, event):
+    parsed = parse_event(state, event)
+    i, day, percent = parsed['i'], parsed['day'], min(max(parsed['percent'], 0), 100)
+    
+    previous_day, previous_percent = state['reported_day'][i], state['percent'][i]
+    
+    # Running EV/AC totals change by this activity's delta only
+    state['EV'] += (percent - previous_percent) / 100 * state['budget'][i]
+    state['percent'][i] = percent
+    if parsed['cost'] is not None:
+        state['AC'] += parsed['cost'] - state['actual'][i]
+        state['actual'][i] = parsed['cost']
+    
+    # First report: back-date the start by the progress already made at the planned rate
+    if state['actual_start'][i] < 0:
+        state['actual_start'][i] = day - round(state['duration'][i] * percent / 100)
+    
+    # Remaining duration from the rate between the last two reports, else the plan
+    if percent >= 100:
+        state['remaining'][i] = 0
+    elif previous_day >= 0 and day > previous_day and percent > previous_percent:
+        state['remaining'][i] = (100 - percent) * (day - previous_day) / (percent - previous_percent)
+    else:
+        state['remaining'][i] = state['duration'][i] * (100 - percent) / 100
+    state['reported_day'][i] = day
+    
+    touched = update_forecast(state, i)
+    finish = forecast_finish(state)
+    cpi = state['EV'] / state['AC'] if state['AC'] != 0 else 0
+    return {
+        'Date': (state['start_date'] + timedelta(days=day)).date().isoformat(),
+        'Activity': state['codes'][i],
+        'Percent_Complete': percent,
+        'EV': state['EV'],
+        'AC': state['AC'],
+        'CPI': cpi,
+        'EAC': state['BAC'] / cpi if cpi != 0 else 0,
+        'Forecast_Duration': finish,
+        'Forecast_Finish': (state['start_date'] + timedelta(days=finish)).date().isoformat(),
+        'Activities_Retimed': touched
+    }
+
+def follow_event_file(path, follow=False, poll_interval=1.0):
+    # JSON lines; with follow=True keep reading appended events like `tail -f`
+    with open(path, encoding='utf-8') as f:
+        buffer = ''
+        while True:
+            line = f.readline()
+            if not line:
+                if not follow:
+                    break
+                time.sleep(poll_interval)
+                continue
+            buffer += line
+            if not buffer.endswith('\n') and follow:
+                continue
+            if buffer.strip():
+                try:
+                    yield json.loads(buffer)
+                except json.JSONDecodeError as e:
+                    print(f"Skipping malformed event line: {e}", file=sys.stderr)
+            buffer = ''
+
+def drain_event_queue(events):
+    # Local producers put event dicts on a queue.Queue and None to stop
+    while True:
+        event = events.get()
+        if event is None:
+            break
+        yield event
+
+def stream_progress(state, events):
+    # A bad event is reported and skipped so one line cannot stop the stream
+    for event in events:
+        try:
+            forecast = apply_progress_event(state, event)
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"Skipping event {event!r}: {e}", file=sys.stderr)
+            continue
+        yield forecast
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Re-forecast finish date and EAC from streamed progress events')
+    parser.add_argument('--events', help='JSON-lines file of {"Activity_Code", "Date", "Percent_Complete", "Actual_Cost"}')
+    parser.add_argument('--follow', action='store_true', help='keep waiting for events appended to the file')
+    args = parser.parse_args()
+    
+    start_date = datetime(2024, 1, 1)
+    state = build_progress_state(activities_data, dependencies_data, start_date)
+    baseline_finish = forecast_finish(state)
+    
+    if args.events:
+        events = follow_event_file(args.events, follow=args.follow)
+    else:
+        # Sample daily site reports fed through a local queue by a producer thread
+        sample_events = [
+            {'Activity_Code': 'D', 'Date': '2024-01-20', 'Percent_Complete': 60, 'Actual_Cost': 1900},
+            {'Activity_Code': 'D', 'Date': '2024-01-22', 'Percent_Complete': 100, 'Actual_Cost': 3100},
+            {'Activity_Code': 'E', 'Date': '2024-01-25', 'Percent_Complete': 30, 'Actual_Cost': 2600},
+            {'Activity_Code': 'E', 'Date': '2024-01-28', 'Percent_Complete': 55, 'Actual_Cost': 4500},
+            {'Activity_Code': 'E', 'Date': '2024-02-01', 'Percent_Complete': 100, 'Actual_Cost': 7400},
+            {'Activity_Code': 'F', 'Date': '2024-02-03', 'Percent_Complete': 50, 'Actual_Cost': 1500},
+            {'Activity_Code': 'F', 'Date': '2024-02-04', 'Percent_Complete': 100, 'Actual_Cost': 2900}
+        ]
+        event_queue = queue.Queue()
+    
+        def produce():
+            for event in sample_events:
+                event_queue.put(event)
+            event_queue.put(None)
+    
+        threading.Thread(target=produce, daemon=True).start()
+        events = drain_event_queue(event_queue)
+    
+    # Print Results
+    print("\nSTREAMING PROGRESS RE-FORECAST")
+    print("=" * 80)
+    print(f"Baseline Finish: {(start_date + timedelta(days=baseline_finish)).date()} ({baseline_finish} days)")
+    print(f"Budget at Completion (BAC): ${state['BAC']:,.2f}")
+    print("-" * 50)
+    for forecast in stream_progress(state, events):
+        print(f"{forecast['Date']}  {forecast['Activity']:<3} {forecast['Percent_Complete']:>5.0f}%  "
+              f"EV ${forecast['EV']:>9,.0f}  AC ${forecast['AC']:>9,.0f}  CPI {forecast['CPI']:.2f}  "
+              f"EAC ${forecast['EAC']:>10,.0f}  Finish {forecast['Forecast_Finish']} "
+              f"({forecast['Forecast_Duration']} days, {forecast['Activities_Retimed']} re-timed)")
@@ -0,0 +1,446 @@
+import pandas as pd
+import numpy as np
+import argparse
+import contextlib
+import html
+import importlib.util
+import io
+import json
+import os
+import time
+from datetime import datetime
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Create activities dataframe with cost and resource data
+activities_data = pd.DataFrame({
+    'Activity_Code': ['A', 'B', 'C1', 'C2', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N',
+                     'O1', 'O2', 'P1', 'P2', 'P3', 'Q1', 'Q2', 'R1', 'R2', 'R3', 'S1', 'S2', 'S3',
+                     'T1', 'T2', 'U', 'V', 'W1', 'W2', 'X', 'Y'],
+    'Duration': [1, 8, 2, 7, 3, 7, 3, 6, 4, 3, 5, 2, 3, 9, 8,
+                 2, 2, 2, 2, 2, 22, 22, 3, 3, 3, 2, 2, 2,
+                 3, 3, 12, 12, 8, 8, 6, 1],
+    'Budget_Cost': [1000, 8000, 2000, 7000, 3000, 7000, 3000, 6000, 4000, 3000, 5000, 2000, 3000,
+                    9000, 8000, 2000, 2000, 2000, 2000, 2000, 22000, 22000, 3000, 3000, 3000,
+                    2000, 2000, 2000, 3000, 3000, 12000, 12000, 8000, 8000, 6000, 1000],
+    'Foremen': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+                1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 1, 1, 1,
+                1, 1, 1, 1, 1, 1, 1, 2],
+    'Workers': [2, 2, 2, 2, 2, 2, 2, 2, 3, 2, 2, 2, 2, 2, 2,
+                2, 2, 2, 2, 2, 2, 2, 3, 3, 3, 2, 2, 2,
+                2, 2, 2, 2, 2, 2, 2, 0]
+})
+
+# Create dependencies dataframe
+dependencies_data = pd.DataFrame({
+    'Activity_Code': activities_data['Activity_Code'],
+    'Prior_Activities': ['-', 'A', 'B', 'C1', 'C2', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M',
+                        'M', 'O1', 'M', 'P1', 'P2', 'N,O2,P3', 'Q1', 'Q2', 'R1', 'R2', 'Q2', 'S1', 'S2',
+                        'R3,S3', 'T1', 'T2', 'U', 'V', 'W1', 'W2', 'X']
+})
+
+def load_script(filename):
+    # The analysis scripts run their sample project on load; keep that output quiet
+    path = os.path.join(SCRIPT_DIR, filename)
+    spec = importlib.util.spec_from_file_location(filename[:-3].replace(' ', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    with contextlib.redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(module)
+    return module
+
+def build_links(activities_df, dependencies_df):
+    # Predecessor/successor row positions from the Prior_Activities strings
+    links = dependencies_df.assign(Predecessor=dependencies_df['Prior_Activities'].fillna('-').str.split(','))
+    links = links.explode('Predecessor')
+    links['Predecessor'] = links['Predecessor'].str.strip()
+    links = links[links['Predecessor'] != '-']
+    index = pd.Index(activities_df['Activity_Code'])
+    pred, succ = index.get_indexer(links['Predecessor']), index.get_indexer(links['Activity_Code'])
+    # -1 would silently link to the last activity
+    unknown = links[(pred < 0) | (succ < 0)]
+    if len(unknown):
+        raise ValueError("Links to unknown activities: " + ', '.join(
+            f"{row.Predecessor} -> {row.Activity_Code}" for row in unknown.itertuples()))
+    return pred, succ
+
+def relax_longest(values, pred, succ, weight):
+    # values[succ] >= values[pred] + weight[pred], repeated until nothing moves;
+    # a longest path has fewer links than activities, so more sweeps than that mean a cycle
+    for _ in range(len(values) + 1):
+        new_values = values.copy()
+        np.maximum.at(new_values, succ, values[pred] + weight[pred])
+        if np.array_equal(new_values, values):
+            return values
+        values = new_values
+    raise ValueError("Dependency cycle in the project network")
+
+def build_dashboard_payload(activities_df, dependencies_df, project_name, start_date):
+    # Every view is drawn from this one payload: CPM dates, links, network layout,
+    # daily crew demand and cost S-curves, all as flat columnar arrays
+    pred, succ = build_links(activities_df, dependencies_df)
+    duration = activities_df['Duration'].to_numpy(dtype=np.int64)
+    n = len(duration)
+    
+    es = relax_longest(np.zeros(n, dtype=np.int64), pred, succ, duration)
+    ef = es + duration
+    project_duration = int(ef.max())
+    lf = np.full(n, project_duration, dtype=np.int64)
+    for _ in range(n + 1):
+        new_lf = lf.copy()
+        np.minimum.at(new_lf, pred, lf[succ] - duration[succ])
+        if np.array_equal(new_lf, lf):
+            break
+        lf = new_lf
+    else:
+        raise ValueError("Dependency cycle in the project network")
+    total_float = lf - ef
+    
+    # Network layout: column = longest link count from a start, rows ordered by ES in each column
+    level = relax_longest(np.zeros(n, dtype=np.int64), pred, succ, np.ones(n, dtype=np.int64))
+    order = np.lexsort((es, level))
+    level_start = np.searchsorted(level[order], level[order], side='left')
+    row = np.empty(n, dtype=np.int64)
+    row[order] = np.arange(n) - level_start
+    
+    # Daily crew demand and early/late cost S-curves with difference arrays
+    daily = {}
+    for resource in ['Foremen', 'Workers']:
+        delta = np.zeros(project_duration + 1)
+        np.add.at(delta, es, activities_df[resource].to_numpy())
+        np.subtract.at(delta, ef, activities_df[resource].to_numpy())
+        daily[resource] = np.cumsum(delta)[:project_duration].astype(int).tolist()
+    budget = activities_df['Budget_Cost'].to_numpy(dtype=np.float64)
+    rate = budget / np.maximum(duration, 1)
+    s_curves = {}
+    for name, start in [('early', es), ('late', lf - duration)]:
+        # Zero-duration activities on the last day book their cost on that day, not past the end
+        start = np.minimum(start, max(project_duration - 1, 0))
+        delta = np.zeros(project_duration + 2)
+        np.add.at(delta, start, rate)
+        np.subtract.at(delta, start + np.maximum(duration, 1), rate)
+        s_curves[name] = np.round(np.cumsum(np.cumsum(delta)[:project_duration])).astype(int).tolist()
+    
+    return {
+        'project': project_name,
+        'start': start_date.strftime('%Y-%m-%d'),
+        'duration': project_duration,
+        'codes': activities_df['Activity_Code'].astype(str).tolist(),
+        'es': es.tolist(),
+        'ef': ef.tolist(),
+        'tf': total_float.tolist(),
+        'foremen': activities_df['Foremen'].astype(int).tolist(),
+        'workers': activities_df['Workers'].astype(int).tolist(),
+        'budget': np.round(budget).astype(int).tolist(),
+        'pred': pred.tolist(),
+        'succ': succ.tolist(),
+        'x': level.tolist(),
+        'y': row.tolist(),
+        'daily': daily,
+        'scurve': s_curves
+    }
+
+def write_dashboard(payload, path):
+    # Compact JSON embedded in a single HTML file; '</' is escaped so the payload cannot end the script tag
+    data = json.dumps(payload, separators=(',', ':')).replace('</', '<\\/')
+    head, tail = DASHBOARD_TEMPLATE.split('__PAYLOAD__')
+    page = head.replace('__TITLE__', html.escape(payload['project'])) + data + tail
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(page)
+    return len(page.encode('utf-8'))
+
+DASHBOARD_TEMPLATE = r'''<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>__TITLE__ - Project Dashboard</title>
+<style>
+body { margin: 0; font: 12px sans-serif; background: #f4f5f7; color: #222; }
+header { display: flex; gap: 16px; align-items: center; padding: 8px 12px; background: #2d3e50; color: #fff; }
+header h1 { font-size: 16px; margin: 0; }
+header input { padding: 3px 6px; width: 140px; }
+#info { flex: 1; text-align: right; }
+main { display: grid; grid-template-columns: 1fr 1fr; grid-template-rows: 46vh 40vh; gap: 8px; padding: 8px; }
+section { background: #fff; border: 1px solid #ccd; display: flex; flex-direction: column; min-height: 0; }
+section h2 { font-size: 12px; margin: 0; padding: 4px 8px; border-bottom: 1px solid #eee; }
+section canvas { flex: 1; width: 100%; min-height: 0; display: block; }
+</style>
+</head>
+<body>
+<header>
+  <h1>__TITLE__</h1>
+  <input id="search" placeholder="Activity code + Enter">
+  <span id="info">Click an activity in the Gantt chart or network</span>
+</header>
+<main>
+  <section><h2>Gantt Chart (critical path in red, float in grey; scroll to browse)</h2><canvas id="gantt"></canvas></section>
+  <section><h2>Network Diagram (drag to pan, wheel to zoom)</h2><canvas id="network"></canvas></section>
+  <section><h2>Daily Crew Demand (foremen + workers)</h2><canvas id="histogram"></canvas></section>
+  <section><h2>Cost S-Curve (early start vs. late start)</h2><canvas id="scurve"></canvas></section>
+</main>
+<script id="payload" type="application/json">__PAYLOAD__</script>
+<script>
+'use strict';
+const P = JSON.parse(document.getElementById('payload').textContent);
+const N = P.codes.length;
+const CRIT = '#e05555', NORMAL = '#6495ed', FLOAT = '#c8c8c8', PRED = '#f0a030', SUCC = '#3aa655', SEL = '#000';
+const codeIndex = new Map(P.codes.map((c, i) => [c, i]));
+
+// Adjacency lists in CSR form for highlighting neighbours
+function csr(from, to) {
+  const ptr = new Int32Array(N + 1);
+  for (const f of from) ptr[f + 1]++;
+  for (let i = 0; i < N; i++) ptr[i + 1] += ptr[i];
+  const idx = new Int32Array(from.length), fill = ptr.slice(0, N);
+  for (let k = 0; k < from.length; k++) idx[fill[from[k]]++] = to[k];
+  return { ptr, idx };
+}
+const succOf = csr(P.pred, P.succ), predOf = csr(P.succ, P.pred);
+const neighbours = (adj, i) => adj.idx.subarray(adj.ptr[i], adj.ptr[i + 1]);
+
+// Gantt rows ordered by early start
+const rows = Int32Array.from({ length: N }, (_, i) => i).sort((a, b) => P.es[a] - P.es[b] || a - b);
+const rowOf = new Int32Array(N);
+rows.forEach((a, r) => { rowOf[a] = r; });
+
+let selected = -1;
+const views = {};
+
+function setupCanvas(id) {
+  const canvas = document.getElementById(id);
+  const ctx = canvas.getContext('2d');
+  const view = { canvas, ctx, w: 0, h: 0 };
+  const resize = () => {
+    const ratio = window.devicePixelRatio || 1;
+    view.w = canvas.clientWidth; view.h = canvas.clientHeight;
+    canvas.width = view.w * ratio; canvas.height = view.h * ratio;
+    ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+  };
+  resize();
+  view.resize = resize;
+  views[id] = view;
+  return view;
+}
+
+function dayLabel(day) {
+  const d = new Date(P.start + 'T00:00:00');
+  d.setDate(d.getDate() + day);
+  return d.toISOString().slice(0, 10);
+}
+
+// ---- Gantt ----
+const gantt = setupCanvas('gantt');
+gantt.rowHeight = 14; gantt.top = 0; gantt.label = 70;
+function drawGantt() {
+  const { ctx, w, h, rowHeight, label } = gantt;
+  ctx.clearRect(0, 0, w, h);
+  const scale = (w - label - 10) / P.duration;
+  const first = Math.floor(gantt.top / rowHeight), last = Math.min(N, first + Math.ceil(h / rowHeight) + 1);
+  ctx.font = '10px sans-serif'; ctx.textBaseline = 'middle';
+  for (let r = first; r < last; r++) {
+    const a = rows[r], y = r * rowHeight - gantt.top;
+    if (a === selected) { ctx.fillStyle = '#fff3c4'; ctx.fillRect(0, y, w, rowHeight); }
+    ctx.fillStyle = '#333'; ctx.fillText(P.codes[a], 4, y + rowHeight / 2);
+    const x0 = label + P.es[a] * scale, x1 = label + P.ef[a] * scale;
+    if (P.tf[a] > 0) { ctx.fillStyle = FLOAT; ctx.fillRect(x1, y + 5, P.tf[a] * scale, 4); }
+    ctx.fillStyle = P.tf[a] === 0 ? CRIT : NORMAL;
+    ctx.fillRect(x0, y + 2, Math.max(1, x1 - x0), rowHeight - 4);
+    if (a === selected) { ctx.strokeStyle = SEL; ctx.strokeRect(x0, y + 2, Math.max(1, x1 - x0), rowHeight - 4); }
+  }
+}
+gantt.canvas.addEventListener('wheel', e => {
+  e.preventDefault();
+  gantt.top = Math.max(0, Math.min(N * gantt.rowHeight - gantt.h, gantt.top + e.deltaY));
+  drawGantt();
+}, { passive: false });
+gantt.canvas.addEventListener('click', e => {
+  const r = Math.floor((e.offsetY + gantt.top) / gantt.rowHeight);
+  if (r >= 0 && r < N) select(rows[r], false);
+});
+
+// ---- Network ----
+const network = setupCanvas('network');
+network.zoom = 1; network.panX = 10; network.panY = 10;
+const COL = 60, ROW = 18;
+const nodeX = i => P.x[i] * COL * network.zoom + network.panX;
+const nodeY = i => P.y[i] * ROW * network.zoom + network.panY;
+function drawNetwork() {
+  const { ctx, w, h } = network;
+  ctx.clearRect(0, 0, w, h);
+  const bw = 40 * network.zoom, bh = 12 * network.zoom;
+  const visible = i => { const x = nodeX(i), y = nodeY(i); return x > -bw && x < w && y > -bh && y < h; };
+  ctx.lineWidth = 1; ctx.strokeStyle = '#ccc'; ctx.beginPath();
+  for (let k = 0; k < P.pred.length; k++) {
+    const a = P.pred[k], b = P.succ[k];
+    if (!visible(a) && !visible(b)) continue;
+    ctx.moveTo(nodeX(a) + bw, nodeY(a) + bh / 2); ctx.lineTo(nodeX(b), nodeY(b) + bh / 2);
+  }
+  ctx.stroke();
+  ctx.font = Math.max(6, 9 * network.zoom) + 'px sans-serif'; ctx.textBaseline = 'middle';
+  for (let i = 0; i < N; i++) {
+    if (!visible(i)) continue;
+    ctx.fillStyle = P.tf[i] === 0 ? CRIT : NORMAL;
+    ctx.fillRect(nodeX(i), nodeY(i), bw, bh);
+    if (network.zoom >= 0.6) { ctx.fillStyle = '#fff'; ctx.fillText(P.codes[i], nodeX(i) + 2, nodeY(i) + bh / 2); }
+  }
+  if (selected < 0) return;
+  const mark = (i, color) => { ctx.strokeStyle = color; ctx.lineWidth = 3; ctx.strokeRect(nodeX(i) - 2, nodeY(i) - 2, bw + 4, bh + 4); };
+  const link = (a, b, color) => {
+    ctx.strokeStyle = color; ctx.lineWidth = 2; ctx.beginPath();
+    ctx.moveTo(nodeX(a) + bw, nodeY(a) + bh / 2); ctx.lineTo(nodeX(b), nodeY(b) + bh / 2); ctx.stroke();
+  };
+  for (const p of neighbours(predOf, selected)) { link(p, selected, PRED); mark(p, PRED); }
+  for (const s of neighbours(succOf, selected)) { link(selected, s, SUCC); mark(s, SUCC); }
+  mark(selected, SEL);
+}
+let drag = null;
+network.canvas.addEventListener('mousedown', e => { drag = { x: e.offsetX, y: e.offsetY, moved: false }; });
+network.canvas.addEventListener('mousemove', e => {
+  if (!drag) return;
+  const dx = e.offsetX - drag.x, dy = e.offsetY - drag.y;
+  if (Math.abs(dx) + Math.abs(dy) > 2) drag.moved = true;
+  network.panX += dx; network.panY += dy; drag.x = e.offsetX; drag.y = e.offsetY;
+  drawNetwork();
+});
+network.canvas.addEventListener('mouseup', e => {
+  if (drag && !drag.moved) {
+    const bw = 40 * network.zoom, bh = 12 * network.zoom;
+    for (let i = 0; i < N; i++) {
+      const x = nodeX(i), y = nodeY(i);
+      if (e.offsetX >= x && e.offsetX <= x + bw && e.offsetY >= y && e.offsetY <= y + bh) { select(i, false); break; }
+    }
+  }
+  drag = null;
+});
+network.canvas.addEventListener('wheel', e => {
+  e.preventDefault();
+  const factor = e.deltaY < 0 ? 1.2 : 1 / 1.2;
+  network.panX = e.offsetX - (e.offsetX - network.panX) * factor;
+  network.panY = e.offsetY - (e.offsetY - network.panY) * factor;
+  network.zoom *= factor;
+  drawNetwork();
+}, { passive: false });
+function centreNetwork(i) {
+  network.panX = network.w / 2 - P.x[i] * COL * network.zoom;
+  network.panY = network.h / 2 - P.y[i] * ROW * network.zoom;
+}
+
+// ---- Shared axes for the daily views ----
+function plotFrame(view, maxValue) {
+  const pad = { l: 50, r: 10, t: 10, b: 20 };
+  return {
+    pad,
+    x: day => pad.l + day * (view.w - pad.l - pad.r) / P.duration,
+    y: value => view.h - pad.b - value * (view.h - pad.t - pad.b) / (maxValue || 1)
+  };
+}
+function drawAxes(view, frame, maxValue, format) {
+  const { ctx, w, h } = view;
+  ctx.strokeStyle = '#999'; ctx.lineWidth = 1; ctx.fillStyle = '#555'; ctx.font = '10px sans-serif';
+  ctx.beginPath(); ctx.moveTo(frame.pad.l, frame.pad.t); ctx.lineTo(frame.pad.l, h - frame.pad.b); ctx.lineTo(w - frame.pad.r, h - frame.pad.b); ctx.stroke();
+  ctx.textBaseline = 'middle'; ctx.textAlign = 'right';
+  for (let k = 0; k <= 4; k++) ctx.fillText(format(maxValue * k / 4), frame.pad.l - 4, frame.y(maxValue * k / 4));
+  ctx.textBaseline = 'top'; ctx.textAlign = 'center';
+  for (let k = 0; k <= 4; k++) ctx.fillText(dayLabel(Math.round(P.duration * k / 4)), frame.x(P.duration * k / 4), h - frame.pad.b + 4);
+  ctx.textAlign = 'left';
+}
+function shadeSelection(view, frame) {
+  if (selected < 0) return;
+  view.ctx.fillStyle = 'rgba(255, 200, 0, 0.25)';
+  view.ctx.fillRect(frame.x(P.es[selected]), frame.pad.t, frame.x(P.ef[selected]) - frame.x(P.es[selected]), view.h - frame.pad.t - frame.pad.b);
+}
+
+// ---- Resource histogram ----
+const histogram = setupCanvas('histogram');
+const crewMax = Math.max(1, ...P.daily.Foremen.map((f, d) => f + P.daily.Workers[d]));
+function drawHistogram() {
+  const { ctx, w, h } = histogram;
+  ctx.clearRect(0, 0, w, h);
+  const frame = plotFrame(histogram, crewMax);
+  shadeSelection(histogram, frame);
+  const bar = Math.max(1, frame.x(1) - frame.x(0) - 0.5);
+  for (let d = 0; d < P.duration; d++) {
+    const f = P.daily.Foremen[d], wk = P.daily.Workers[d];
+    ctx.fillStyle = '#8899aa'; ctx.fillRect(frame.x(d), frame.y(f), bar, frame.y(0) - frame.y(f));
+    ctx.fillStyle = '#b8c8d8'; ctx.fillRect(frame.x(d), frame.y(f + wk), bar, frame.y(f) - frame.y(f + wk));
+  }
+  if (selected >= 0) {
+    // The selected activity's own crew on its working days
+    const crew = P.foremen[selected] + P.workers[selected];
+    ctx.fillStyle = P.tf[selected] === 0 ? CRIT : NORMAL;
+    for (let d = P.es[selected]; d < P.ef[selected]; d++) ctx.fillRect(frame.x(d), frame.y(crew), bar, frame.y(0) - frame.y(crew));
+  }
+  drawAxes(histogram, frame, crewMax, v => v.toFixed(0));
+}
+
+// ---- S-curve ----
+const scurve = setupCanvas('scurve');
+const costMax = Math.max(1, P.scurve.early[P.duration - 1] || 0);
+function drawSCurve() {
+  const { ctx, w, h } = scurve;
+  ctx.clearRect(0, 0, w, h);
+  const frame = plotFrame(scurve, costMax);
+  shadeSelection(scurve, frame);
+  const line = (values, color) => {
+    ctx.strokeStyle = color; ctx.lineWidth = 2; ctx.beginPath(); ctx.moveTo(frame.x(0), frame.y(0));
+    values.forEach((v, d) => ctx.lineTo(frame.x(d + 1), frame.y(v)));
+    ctx.stroke();
+  };
+  line(P.scurve.early, NORMAL);
+  line(P.scurve.late, CRIT);
+  ctx.fillStyle = NORMAL; ctx.fillText('Early start', frame.pad.l + 8, frame.pad.t + 6);
+  ctx.fillStyle = CRIT; ctx.fillText('Late start', frame.pad.l + 8, frame.pad.t + 20);
+  drawAxes(scurve, frame, costMax, v => v >= 1e6 ? (v / 1e6).toFixed(1) + 'M' : (v / 1e3).toFixed(0) + 'k');
+}
+
+// ---- Linked selection ----
+function drawAll() { drawGantt(); drawNetwork(); drawHistogram(); drawSCurve(); }
+function select(i, recentre) {
+  selected = i;
+  const r = rowOf[i];
+  if (recentre || r * gantt.rowHeight < gantt.top || (r + 1) * gantt.rowHeight > gantt.top + gantt.h) {
+    gantt.top = Math.max(0, r * gantt.rowHeight - gantt.h / 2);
+  }
+  if (recentre) centreNetwork(i);
+  const preds = Array.from(neighbours(predOf, i), p => P.codes[p]).join(', ') || '-';
+  document.getElementById('info').textContent =
+    `${P.codes[i]}: ${dayLabel(P.es[i])} to ${dayLabel(P.ef[i])} (${P.ef[i] - P.es[i]} d), float ${P.tf[i]} d, ` +
+    `${P.foremen[i]} foremen / ${P.workers[i]} workers, budget ${P.budget[i].toLocaleString()}, after ${preds}`;
+  drawAll();
+}
+document.getElementById('search').addEventListener('keydown', e => {
+  if (e.key !== 'Enter') return;
+  const i = codeIndex.get(e.target.value.trim());
+  if (i !== undefined) select(i, true);
+});
+window.addEventListener('resize', () => { Object.values(views).forEach(v => v.resize()); drawAll(); });
+drawAll();
+</script>
+</body>
+</html>
+'''
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Write a single-file interactive project dashboard')
+    parser.add_argument('--activities', type=int, help='use a synthetic project of this size instead of the sample project')
+    parser.add_argument('--output', default=os.path.join(SCRIPT_DIR, 'project-dashboard.html'))
+    args = parser.parse_args()
+    
+    if args.activities:
+        generator = load_script('Synthetic Project Generator.py')
+        project_activities, project_dependencies = generator.generate_project(args.activities)
+        project_name = f'Synthetic Project ({args.activities:,} activities)'
+    else:
+        project_activities, project_dependencies = activities_data, dependencies_data
+        project_name = 'Taiwan Construction Project'
+    
+    start_time = time.perf_counter()
+    payload = build_dashboard_payload(project_activities, project_dependencies, project_name, datetime(2024, 1, 1))
+    file_size = write_dashboard(payload, args.output)
+    elapsed = time.perf_counter() - start_time
+    
+    # Print Results
+    print("\nPROJECT DASHBOARD")
+    print("=" * 80)
+    print(f"Project: {project_name}")
+    print(f"Activities: {len(payload['codes']):,}, links: {len(payload['pred']):,}, duration: {payload['duration']} days")
+    print(f"Dashboard: {args.output} ({file_size / 2**20:.2f} MB, built in {elapsed:.2f} s)")
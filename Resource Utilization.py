@@ -101,6 +101,8 @@ def calculate_cpm(activities_df, dependencies_df):
 def analyze_resources(activities_df, cpm_results):
     project_duration = cpm_results['project_duration']
     results_df = cpm_results['results']
+    # Index by code once so each lookup is a hash probe instead of a column scan
+    crews = activities_df.set_index('Activity_Code')[['Foremen', 'Workers']]
     
     # Initialize resource arrays
     foremen_usage = np.zeros(project_duration + 1)
@@ -113,8 +115,8 @@ def analyze_resources(activities_df, cpm_results):
         act_code = activity['Activity']
         
         # Get resource requirements
-        foremen = activities_df.loc[activities_df['Activity_Code'] == act_code, 'Foremen'].values[0]
-        workers = activities_df.loc[activities_df['Activity_Code'] == act_code, 'Workers'].values[0]
+        foremen = crews.at[act_code, 'Foremen']
+        workers = crews.at[act_code, 'Workers']
         
         # Add resources for duration of activity
         for day in range(int(es), int(ef)):
@@ -138,8 +140,8 @@ def analyze_resources(activities_df, cpm_results):
     for _, activity in results_df.iterrows():
         if activity['Total_Float'] > 0:
             act_code = activity['Activity']
-            foremen = activities_df.loc[activities_df['Activity_Code'] == act_code, 'Foremen'].values[0]
-            workers = activities_df.loc[activities_df['Activity_Code'] == act_code, 'Workers'].values[0]
+            foremen = crews.at[act_code, 'Foremen']
+            workers = crews.at[act_code, 'Workers']
             
             if foremen > 0 or workers > 0:
                 leveling_opportunities.append({
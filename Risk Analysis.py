@@ -1,6 +1,9 @@
 import pandas as pd
 import numpy as np
 import networkx as nx
+import operator
+import json
+import os
 
 # Create activities dataframe
 activities_data = pd.DataFrame({
@@ -96,6 +99,8 @@ def calculate_cpm(activities_df, dependencies_df):
 def calculate_resource_metrics(activities_df, cpm_results):
     project_duration = cpm_results['project_duration']
     results_df = cpm_results['results']
+    # Index by code once so each lookup is a hash probe instead of a column scan
+    crews = activities_df.set_index('Activity_Code')[['Foremen', 'Workers']]
     
     daily_foremen = np.zeros(project_duration + 1)
     daily_workers = np.zeros(project_duration + 1)
@@ -105,8 +110,8 @@ def calculate_resource_metrics(activities_df, cpm_results):
         ef = int(activity['EF'])
         act_code = activity['Activity']
         
-        foremen = activities_df.loc[activities_df['Activity_Code'] == act_code, 'Foremen'].values[0]
-        workers = activities_df.loc[activities_df['Activity_Code'] == act_code, 'Workers'].values[0]
+        foremen = crews.at[act_code, 'Foremen']
+        workers = crews.at[act_code, 'Workers']
         
         for day in range(es, ef):
             daily_foremen[day] += foremen
@@ -121,7 +126,77 @@ def calculate_resource_metrics(activities_df, cpm_results):
         'Avg_Workers': np.mean(daily_workers)
     }
 
-def analyze_risks(activities_df, cpm_results, resource_metrics):
+RULE_OPERATORS = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+    'in': lambda column, value: column.isin(value)
+}
+
+def load_risk_rules(path):
+    with open(path, encoding='utf-8') as f:
+        if path.endswith(('.yaml', '.yml')):
+            import yaml
+            rules = yaml.safe_load(f)
+        else:
+            rules = json.load(f)
+    return compile_risk_rules(rules)
+
+def compile_condition(condition):
+    # Turn a declarative condition into a function returning a boolean mask for a whole frame
+    if 'all' in condition:
+        parts = [compile_condition(c) for c in condition['all']]
+        return lambda df: np.logical_and.reduce([part(df) for part in parts])
+    if 'any' in condition:
+        parts = [compile_condition(c) for c in condition['any']]
+        return lambda df: np.logical_or.reduce([part(df) for part in parts])
+    if 'not' in condition:
+        part = compile_condition(condition['not'])
+        return lambda df: ~np.asarray(part(df))
+    
+    compare = RULE_OPERATORS[condition['op']]
+    column = condition['column']
+    value = condition['value']
+    return lambda df: np.asarray(compare(df[column], value))
+
+def compile_risk_rules(rules):
+    critical = rules['critical_activities']
+    compiled = dict(rules)
+    compiled['critical_activities'] = dict(critical, when=compile_condition(critical['when']))
+    compiled['critical_activities']['impact_levels'] = [
+        dict(level, when=compile_condition(level['when'])) for level in critical['impact_levels']
+    ]
+    compiled['schedule_constraints'] = [
+        dict(rule, when=compile_condition(rule['when'])) for rule in rules['schedule_constraints']
+    ]
+    return compiled
+
+def apply_risk_rules(results_df, risk_rules):
+    # Evaluate every rule over the whole frame at once; works equally on a single
+    # project's CPM results or a portfolio frame of many projects stacked together.
+    # Constraint matches are kept apart from the frame so a rule type can never
+    # overwrite a schedule column such as Duration or ES.
+    rule_results = results_df.copy()
+    
+    critical = risk_rules['critical_activities']
+    rule_results['Critical_Rule'] = critical['when'](results_df)
+    rule_results['Impact_Level'] = np.select(
+        [level['when'](results_df) for level in critical['impact_levels']],
+        [level['level'] for level in critical['impact_levels']],
+        default=critical['default_level']
+    )
+    
+    constraint_matches = [rule['when'](results_df) for rule in risk_rules['schedule_constraints']]
+    
+    return rule_results, constraint_matches
+
+def analyze_risks(activities_df, cpm_results, resource_metrics, risk_rules):
+    results_df = cpm_results['results']
+    rule_results, constraint_matches = apply_risk_rules(results_df, risk_rules)
+    
     risk_analysis = {
         'critical_activities': [],
         'resource_bottlenecks': [],
@@ -129,17 +204,9 @@ def analyze_risks(activities_df, cpm_results, resource_metrics):
     }
     
     # 1. Analyze Critical Activities (Zero Float)
-    critical_activities = cpm_results['results'][cpm_results['results']['Critical'] == True]
-    for _, activity in critical_activities.iterrows():
-        duration = activity['Duration']
-        impact_level = 'High' if duration > 10 else 'Medium' if duration > 5 else 'Low'
-        risk_analysis['critical_activities'].append({
-            'Activity': activity['Activity'],
-            'Duration': duration,
-            'Impact_Level': impact_level,
-            'ES': activity['ES'],
-            'EF': activity['EF']
-        })
+    critical_activities = rule_results[rule_results['Critical_Rule']]
+    risk_analysis['critical_activities'] = critical_activities[
+        ['Activity', 'Duration', 'Impact_Level', 'ES', 'EF']].to_dict('records')
     
     # 2. Analyze Resource Bottlenecks
     daily_resource_usage = resource_metrics['Daily_Foremen']
@@ -159,34 +226,125 @@ def analyze_risks(activities_df, cpm_results, resource_metrics):
             })
     
     # 3. Analyze Schedule Constraints
-    results_df = cpm_results['results']
-    for _, activity in results_df.iterrows():
-        if activity['Duration'] > 15:
-            risk_analysis['schedule_constraints'].append({
-                'Type': 'Long Duration',
-                'Activity': activity['Activity'],
-                'Duration': activity['Duration'],
-                'Risk_Level': 'High'
-            })
-        
-        if 0 < activity['Total_Float'] <= 3:
-            risk_analysis['schedule_constraints'].append({
-                'Type': 'Tight Sequence',
-                'Activity': activity['Activity'],
-                'Float': activity['Total_Float'],
-                'Risk_Level': 'Medium'
-            })
+    constraints = []
+    for rule_order, rule in enumerate(risk_rules['schedule_constraints']):
+        matched = rule_results[constraint_matches[rule_order]]
+        frame = pd.DataFrame({'Type': rule['type'], 'Activity': matched['Activity']})
+        for label, column in rule['report'].items():
+            frame[label] = matched[column]
+        frame['Risk_Level'] = rule['risk_level']
+        constraints.extend(
+            (position, rule_order, record)
+            for position, record in zip(matched.index, frame.to_dict('records'))
+        )
+    
+    # Keep activity order, with the constraints of one activity in rule order
+    constraints.sort(key=lambda c: c[:2])
+    risk_analysis['schedule_constraints'] = [record for _, _, record in constraints]
 
     return risk_analysis
 
+def build_schedule_network(activity_codes, dependencies_df):
+    G = nx.DiGraph()
+    G.add_nodes_from(activity_codes)
+    
+    for _, row in dependencies_df.iterrows():
+        if pd.notna(row['Prior_Activities']) and row['Prior_Activities'] != '-':
+            predecessors = row['Prior_Activities'].split(',')
+            for pred in predecessors:
+                G.add_edge(pred.strip(), row['Activity_Code'])
+    
+    # Work with column positions of the duration matrix instead of activity codes
+    index = {code: i for i, code in enumerate(activity_codes)}
+    return {
+        'order': [index[n] for n in nx.topological_sort(G)],
+        'predecessors': [[index[p] for p in G.predecessors(code)] for code in activity_codes]
+    }
+
+def calculate_finish_times(durations, network):
+    # Forward pass over the activity order, vectorized across iterations
+    ef = np.empty_like(durations)
+    for i in network['order']:
+        es = np.zeros(durations.shape[0], dtype=durations.dtype)
+        for p in network['predecessors'][i]:
+            np.maximum(es, ef[:, p], out=es)
+        ef[:, i] = es + durations[:, i]
+    return ef.max(axis=1)
+
+def simulate_risk_register(activities_df, dependencies_df, risk_register, n_iterations=100000, seed=42):
+    rng = np.random.default_rng(seed)
+    activity_codes = list(activities_df['Activity_Code'])
+    index = {code: i for i, code in enumerate(activity_codes)}
+    network = build_schedule_network(activity_codes, dependencies_df)
+    
+    n_events = len(risk_register)
+    base_durations = activities_df['Duration'].to_numpy(dtype=np.float32)
+    probabilities = np.array([event['Probability'] for event in risk_register])
+    
+    # Bernoulli occurrence mask per iteration and event
+    occurs = rng.random((n_iterations, n_events)) < probabilities
+    
+    # Triangular (min, most likely, max) delay and cost impact, zero where the event did not occur
+    delays = np.zeros((n_iterations, n_events), dtype=np.float32)
+    costs = np.zeros((n_iterations, n_events))
+    impact = np.zeros((n_events, len(activity_codes)), dtype=np.float32)
+    for e, event in enumerate(risk_register):
+        delays[:, e] = np.where(occurs[:, e], rng.triangular(*event['Delay'], size=n_iterations), 0)
+        costs[:, e] = np.where(occurs[:, e], rng.triangular(*event['Cost'], size=n_iterations), 0)
+        impact[e, [index[code] for code in event['Activities']]] = 1
+    
+    # Every affected activity is extended by the event's delay in that iteration
+    durations = base_durations + delays @ impact
+    finish = calculate_finish_times(durations, network)
+    risk_cost = costs.sum(axis=1)
+    
+    # Contribution of each event: finish with all events minus finish with that event removed,
+    # using the same random draws for both runs
+    contributions = []
+    for e, event in enumerate(risk_register):
+        finish_without = calculate_finish_times(durations - np.outer(delays[:, e], impact[e]), network)
+        contributions.append({
+            'Event': event['Event'],
+            'Probability': event['Probability'],
+            'Occurrence_Rate': occurs[:, e].mean(),
+            'Mean_Delay_Contribution': (finish - finish_without).mean(),
+            'Mean_Cost_Contribution': costs[:, e].mean()
+        })
+    
+    return {
+        'Finish': finish,
+        'Risk_Cost': risk_cost,
+        'Event_Contributions': pd.DataFrame(contributions).sort_values('Mean_Delay_Contribution', ascending=False)
+    }
+
+# Probabilistic risk events: affected activities with triangular delay (days) and cost impact
+risk_register = [
+    {'Event': 'Typhoon_Stoppage', 'Probability': 0.35, 'Activities': ['Q1', 'Q2', 'W2', 'X'],
+     'Delay': (2, 4, 10), 'Cost': (10000, 20000, 60000)},
+    {'Event': 'Structural_Testing_Failure', 'Probability': 0.15, 'Activities': ['K'],
+     'Delay': (3, 5, 10), 'Cost': (5000, 8000, 20000)},
+    {'Event': 'Steel_Material_Delay', 'Probability': 0.25, 'Activities': ['Q1'],
+     'Delay': (2, 5, 14), 'Cost': (2000, 5000, 15000)},
+    {'Event': 'Glass_Material_Delay', 'Probability': 0.20, 'Activities': ['P3'],
+     'Delay': (1, 3, 7), 'Cost': (1000, 2000, 5000)},
+    {'Event': 'Heavy_Rain', 'Probability': 0.50, 'Activities': ['B', 'C2', 'X'],
+     'Delay': (1, 2, 4), 'Cost': (1000, 3000, 8000)}
+]
+
 # Run CPM analysis
 cpm_results = calculate_cpm(activities_data, dependencies_data)
 
 # Calculate resource metrics
 resource_metrics = calculate_resource_metrics(activities_data, cpm_results)
 
+# Load risk classification rules
+risk_rules = load_risk_rules(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'risk-rules.json'))
+
 # Run risk analysis
-risk_results = analyze_risks(activities_data, cpm_results, resource_metrics)
+risk_results = analyze_risks(activities_data, cpm_results, resource_metrics, risk_rules)
+
+# Simulate the risk register over the schedule network
+risk_simulation = simulate_risk_register(activities_data, dependencies_data, risk_register)
 
 # Print Results
 print("\nRISK ANALYSIS RESULTS")
@@ -219,6 +377,19 @@ if not constraints_df.empty:
 else:
     print("No significant schedule constraints found.")
 
+print("\n4. RISK EVENT SIMULATION")
+print("-" * 50)
+finish = risk_simulation['Finish']
+risk_cost = risk_simulation['Risk_Cost']
+print(f"Iterations: {len(finish)}")
+print(f"Deterministic Finish: {cpm_results['project_duration']} days")
+print(f"Risk-Adjusted Finish: mean {finish.mean():.1f}, P50 {np.percentile(finish, 50):.1f}, "
+      f"P80 {np.percentile(finish, 80):.1f}, P90 {np.percentile(finish, 90):.1f} days")
+print(f"Risk Cost Impact: mean ${risk_cost.mean():,.0f}, P80 ${np.percentile(risk_cost, 80):,.0f}, "
+      f"P90 ${np.percentile(risk_cost, 90):,.0f}")
+print("\nEvent Contributions:")
+print(risk_simulation['Event_Contributions'].to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+
 print("\nRECOMMENDATIONS:")
 print("-" * 50)
 print("1. Critical Activities:")
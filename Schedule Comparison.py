@@ -0,0 +1,220 @@
+import pandas as pd
+import numpy as np
+import networkx as nx
+
+# Create baseline activities dataframe
+activities_data = pd.DataFrame({
+    'Activity_Code': ['A', 'B', 'C1', 'C2', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 
+                     'O1', 'O2', 'P1', 'P2', 'P3', 'Q1', 'Q2', 'R1', 'R2', 'R3', 'S1', 'S2', 'S3', 
+                     'T1', 'T2', 'U', 'V', 'W1', 'W2', 'X', 'Y'],
+    'Duration': [1, 8, 2, 7, 3, 7, 3, 6, 4, 3, 5, 2, 3, 9, 8, 
+                 2, 2, 2, 2, 2, 22, 22, 3, 3, 3, 2, 2, 2, 
+                 3, 3, 12, 12, 8, 8, 6, 1]
+})
+
+# Create baseline dependencies dataframe
+dependencies_data = pd.DataFrame({
+    'Activity_Code': ['A', 'B', 'C1', 'C2', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N',
+                     'O1', 'O2', 'P1', 'P2', 'P3', 'Q1', 'Q2', 'R1', 'R2', 'R3', 'S1', 'S2', 'S3',
+                     'T1', 'T2', 'U', 'V', 'W1', 'W2', 'X', 'Y'],
+    'Prior_Activities': ['-', 'A', 'B', 'C1', 'C2', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M',
+                        'M', 'O1', 'M', 'P1', 'P2', 'N,O2,P3', 'Q1', 'Q2', 'R1', 'R2', 'Q2', 'S1', 'S2',
+                        'R3,S3', 'T1', 'T2', 'U', 'V', 'W1', 'W2', 'X']
+})
+
+def calculate_cpm(activities_df, dependencies_df):
+    G = nx.DiGraph()
+    
+    for _, row in activities_df.iterrows():
+        G.add_node(row['Activity_Code'], duration=row['Duration'])
+    
+    for _, row in dependencies_df.iterrows():
+        if pd.notna(row['Prior_Activities']) and row['Prior_Activities'] != '-':
+            predecessors = row['Prior_Activities'].split(',')
+            for pred in predecessors:
+                G.add_edge(pred.strip(), row['Activity_Code'])
+    
+    early_times = {}
+    for node in nx.topological_sort(G):
+        predecessors = list(G.predecessors(node))
+        if not predecessors:
+            early_times[node] = {'ES': 0, 'EF': G.nodes[node]['duration']}
+        else:
+            es = max(early_times[p]['EF'] for p in predecessors)
+            early_times[node] = {
+                'ES': es,
+                'EF': es + G.nodes[node]['duration']
+            }
+    
+    late_times = {}
+    project_duration = max(t['EF'] for t in early_times.values())
+    
+    for node in reversed(list(nx.topological_sort(G))):
+        successors = list(G.successors(node))
+        if not successors:
+            late_times[node] = {
+                'LF': project_duration,
+                'LS': project_duration - G.nodes[node]['duration']
+            }
+        else:
+            lf = min(late_times[s]['LS'] for s in successors)
+            late_times[node] = {
+                'LF': lf,
+                'LS': lf - G.nodes[node]['duration']
+            }
+    
+    float_times = {}
+    critical_path = []
+    
+    for node in G.nodes():
+        total_float = late_times[node]['LS'] - early_times[node]['ES']
+        float_times[node] = total_float
+        if total_float == 0:
+            critical_path.append(node)
+    
+    results_df = pd.DataFrame({
+        'Activity': list(G.nodes()),
+        'Duration': [G.nodes[n]['duration'] for n in G.nodes()],
+        'ES': [early_times[n]['ES'] for n in G.nodes()],
+        'EF': [early_times[n]['EF'] for n in G.nodes()],
+        'LS': [late_times[n]['LS'] for n in G.nodes()],
+        'LF': [late_times[n]['LF'] for n in G.nodes()],
+        'Total_Float': [float_times[n] for n in G.nodes()],
+        'Critical': [n in critical_path for n in G.nodes()]
+    })
+    
+    return {
+        'project_duration': project_duration,
+        'critical_path': critical_path,
+        'results': results_df
+    }
+
+def parse_predecessors(prior_activities):
+    if pd.isna(prior_activities) or prior_activities == '-':
+        return set()
+    return {pred.strip() for pred in prior_activities.split(',')}
+
+def align_by_code(baseline_codes, current_codes):
+    # Hash-based alignment: position of every current activity in the baseline (-1 if new)
+    position = pd.Index(baseline_codes).get_indexer(current_codes)
+    in_current = np.zeros(len(baseline_codes), dtype=bool)
+    in_current[position[position >= 0]] = True
+    return position, in_current
+
+def compare_links(baseline_dependencies, current_dependencies):
+    position, in_current = align_by_code(baseline_dependencies['Activity_Code'],
+                                         current_dependencies['Activity_Code'])
+    baseline_prior = baseline_dependencies['Prior_Activities'].to_numpy()
+    current_prior = current_dependencies['Prior_Activities'].to_numpy()
+    
+    # Only activities whose predecessor text differs (or that were added/removed) are parsed
+    matched = position >= 0
+    changed = ~matched
+    changed[matched] = current_prior[matched] != baseline_prior[position[matched]]
+    
+    added_links = []
+    removed_links = []
+    current_codes = current_dependencies['Activity_Code'].to_numpy()
+    for i in np.flatnonzero(changed):
+        before = parse_predecessors(baseline_prior[position[i]]) if position[i] >= 0 else set()
+        after = parse_predecessors(current_prior[i])
+        added_links.extend((pred, current_codes[i]) for pred in sorted(after - before))
+        removed_links.extend((pred, current_codes[i]) for pred in sorted(before - after))
+    
+    baseline_codes = baseline_dependencies['Activity_Code'].to_numpy()
+    for i in np.flatnonzero(~in_current):
+        removed_links.extend((pred, baseline_codes[i]) for pred in sorted(parse_predecessors(baseline_prior[i])))
+    
+    return (pd.DataFrame(added_links, columns=['Predecessor', 'Successor']),
+            pd.DataFrame(removed_links, columns=['Predecessor', 'Successor']))
+
+def compare_schedules(baseline_cpm, current_cpm, baseline_dependencies, current_dependencies):
+    time_columns = ['Duration', 'ES', 'EF', 'LS', 'LF', 'Total_Float']
+    baseline = baseline_cpm['results']
+    current = current_cpm['results']
+    
+    position, in_current = align_by_code(baseline['Activity'], current['Activity'])
+    matched = position >= 0
+    added_activities = current['Activity'].to_numpy()[~matched].tolist()
+    removed_activities = baseline['Activity'].to_numpy()[~in_current].tolist()
+    
+    # Column-wise slippage for activities present in both versions
+    baseline_rows = position[matched]
+    activity_changes = pd.DataFrame({'Activity': current['Activity'].to_numpy()[matched]})
+    for column in time_columns:
+        activity_changes[f'{column}_Change'] = (current[column].to_numpy()[matched]
+                                                - baseline[column].to_numpy()[baseline_rows])
+    activity_changes['Critical_Baseline'] = baseline['Critical'].to_numpy(dtype=bool)[baseline_rows]
+    activity_changes['Critical_Current'] = current['Critical'].to_numpy(dtype=bool)[matched]
+    
+    change_columns = [f'{column}_Change' for column in time_columns]
+    changed = (activity_changes[change_columns].to_numpy() != 0).any(axis=1) | (
+        activity_changes['Critical_Baseline'].to_numpy() != activity_changes['Critical_Current'].to_numpy())
+    activity_changes = activity_changes[changed].reset_index(drop=True)
+    
+    became_critical = activity_changes.loc[
+        ~activity_changes['Critical_Baseline'] & activity_changes['Critical_Current'], 'Activity'].tolist()
+    no_longer_critical = activity_changes.loc[
+        activity_changes['Critical_Baseline'] & ~activity_changes['Critical_Current'], 'Activity'].tolist()
+    
+    added_links, removed_links = compare_links(baseline_dependencies, current_dependencies)
+    
+    return {
+        'finish_slippage': current_cpm['project_duration'] - baseline_cpm['project_duration'],
+        'added_activities': added_activities,
+        'removed_activities': removed_activities,
+        'added_links': added_links,
+        'removed_links': removed_links,
+        'activity_changes': activity_changes,
+        'became_critical': became_critical,
+        'no_longer_critical': no_longer_critical
+    }
+
+# Weekly update: steel roof delivery slipped, one door frame dropped, external works split out
+current_activities = activities_data.copy()
+current_activities.loc[current_activities['Activity_Code'] == 'Q1', 'Duration'] = 25
+current_activities.loc[current_activities['Activity_Code'] == 'S2', 'Duration'] = 6
+current_activities = current_activities[current_activities['Activity_Code'] != 'O2']
+current_activities = pd.concat([current_activities, pd.DataFrame({'Activity_Code': ['Z'], 'Duration': [4]})],
+                               ignore_index=True)
+
+current_dependencies = dependencies_data[dependencies_data['Activity_Code'] != 'O2'].copy()
+current_dependencies.loc[current_dependencies['Activity_Code'] == 'Q1', 'Prior_Activities'] = 'N,O1,P3'
+current_dependencies = pd.concat([current_dependencies,
+                                  pd.DataFrame({'Activity_Code': ['Z'], 'Prior_Activities': ['W2']})],
+                                 ignore_index=True)
+
+# Run CPM analysis on both versions
+baseline_results = calculate_cpm(activities_data, dependencies_data)
+current_results = calculate_cpm(current_activities, current_dependencies)
+
+# Compare the schedule versions
+comparison = compare_schedules(baseline_results, current_results, dependencies_data, current_dependencies)
+
+# Print Results
+print("\nSCHEDULE COMPARISON RESULTS")
+print("=" * 80)
+print(f"Baseline Duration: {baseline_results['project_duration']} days")
+print(f"Current Duration: {current_results['project_duration']} days")
+print(f"Finish Slippage: {comparison['finish_slippage']:+g} days")
+
+print("\nActivity Changes:")
+print("-" * 50)
+print(f"Added Activities: {', '.join(comparison['added_activities']) or 'None'}")
+print(f"Removed Activities: {', '.join(comparison['removed_activities']) or 'None'}")
+
+print("\nLink Changes:")
+print("-" * 50)
+for _, link in comparison['added_links'].iterrows():
+    print(f"+ {link['Predecessor']} -> {link['Successor']}")
+for _, link in comparison['removed_links'].iterrows():
+    print(f"- {link['Predecessor']} -> {link['Successor']}")
+
+print("\nCritical Path Changes:")
+print("-" * 50)
+print(f"Became Critical: {', '.join(comparison['became_critical']) or 'None'}")
+print(f"No Longer Critical: {', '.join(comparison['no_longer_critical']) or 'None'}")
+
+print("\nActivity Slippage:")
+print("-" * 50)
+print(comparison['activity_changes'].to_string(index=False))
\ No newline at end of file
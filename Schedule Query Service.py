@@ -0,0 +1,270 @@
+import numpy as np
+import argparse
+import asyncio
+import contextlib
+import importlib.util
+import io
+import json
+import os
+from collections import OrderedDict
+from datetime import datetime
+from urllib.parse import urlsplit, parse_qs
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def load_script(filename):
+    # The analysis scripts run their sample project on load; keep that output quiet
+    path = os.path.join(SCRIPT_DIR, filename)
+    spec = importlib.util.spec_from_file_location(filename[:-3].replace(' ', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    with contextlib.redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(module)
+    return module
+
+cpm = load_script('CPM method.py')
+eva = load_script('Cost and Earned Value Analysis.py')
+resources = load_script('Resource Utilization.py')
+
+# Create activities dataframe with resource and cost data
+activities_data = eva.activities_data.merge(
+    resources.activities_data[['Activity_Code', 'Foremen', 'Workers']], on='Activity_Code')
+dependencies_data = cpm.dependencies_data.copy()
+
+def build_schedule_bundle(activities_df, dependencies_df):
+    cpm_results = cpm.calculate_cpm(activities_df, dependencies_df)
+    results_df = cpm_results['results']
+    project_duration = int(cpm_results['project_duration'])
+    
+    # Daily crew demand with difference arrays, plus running totals for O(1) range sums
+    resource_columns = activities_df.set_index('Activity_Code').loc[results_df['Activity'], ['Foremen', 'Workers']]
+    es = results_df['ES'].to_numpy(dtype=np.int64)
+    ef = results_df['EF'].to_numpy(dtype=np.int64)
+    crew_demand = {}
+    for resource in ['Foremen', 'Workers']:
+        delta = np.zeros(project_duration + 2)
+        np.add.at(delta, es, resource_columns[resource].to_numpy())
+        np.subtract.at(delta, ef, resource_columns[resource].to_numpy())
+        daily = np.cumsum(delta)[:project_duration + 1]
+        crew_demand[resource] = {
+            'daily': daily,
+            'cumulative': np.concatenate([[0], np.cumsum(daily)])
+        }
+    
+    activity_index = {
+        record['Activity']: {key: (value.item() if hasattr(value, 'item') else value) for key, value in record.items()}
+        for record in results_df.to_dict('records')
+    }
+    
+    return {
+        'project_duration': project_duration,
+        'critical_paths': [p['path'] for p in cpm.find_critical_paths(cpm_results)],
+        'activities': activity_index,
+        'crew_demand': crew_demand
+    }
+
+def evaluate_evm(activities_df, current_date):
+    # Depends on the status date, so it is computed per request instead of cached
+    return {key: float(value) for key, value in eva.perform_earned_value_analysis(activities_df, current_date).items()}
+
+def create_service(cache_size=64):
+    return {
+        'projects': {},
+        'cache': OrderedDict(),
+        'cache_size': cache_size,
+        'locks': {}
+    }
+
+def add_project(service, project_id, activities_df, dependencies_df, start_date):
+    service['projects'][project_id] = {
+        'version': 1,
+        'activities': activities_df.copy(),
+        'dependencies': dependencies_df.copy(),
+        'start_date': start_date
+    }
+    service['locks'][project_id] = asyncio.Lock()
+
+async def get_bundle(service, project_id):
+    project = service['projects'][project_id]
+    # Snapshot the version with its data so a concurrent update cannot mix them
+    key = (project_id, project['version'])
+    activities_df, dependencies_df = project['activities'], project['dependencies']
+    cache = service['cache']
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+    
+    # One computation per project version even when many requests miss at once
+    async with service['locks'][project_id]:
+        if key not in cache:
+            bundle = await asyncio.to_thread(build_schedule_bundle, activities_df, dependencies_df)
+            cache[key] = bundle
+            while len(cache) > service['cache_size']:
+                cache.popitem(last=False)
+    return cache[key]
+
+# Accepted range per field; a huge Duration would size the crew-demand arrays
+FIELD_LIMITS = {'Duration': (0, 3650)}
+
+def coerce_value(column, series, value):
+    # JSON values must fit the column dtype; e.g. 10.5 is not a valid integer Duration
+    if np.issubdtype(series.dtype, np.number):
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not np.isfinite(value):
+            raise ValueError(f"{column} must be a number")
+        if np.issubdtype(series.dtype, np.integer):
+            if value != int(value):
+                raise ValueError(f"{column} must be an integer")
+            value = int(value)
+        low, high = FIELD_LIMITS.get(column, (-np.inf, np.inf))
+        if not low <= value <= high:
+            raise ValueError(f"{column} must be between {low} and {high}")
+        return series.dtype.type(value)
+    if not isinstance(value, str):
+        raise ValueError(f"{column} must be a string")
+    return value
+
+def update_activity(service, project_id, activity_code, changes):
+    project = service['projects'][project_id]
+    if not isinstance(changes, dict):
+        raise ValueError("Request body must be a JSON object")
+    rows = project['activities']['Activity_Code'] == activity_code
+    if not rows.any():
+        raise KeyError(activity_code)
+    values = {}
+    for column, value in changes.items():
+        if column not in project['activities'].columns or column == 'Activity_Code':
+            raise ValueError(f"Unknown or read-only field: {column}")
+        values[column] = coerce_value(column, project['activities'][column], value)
+    
+    # Copy on write so a computation still running on the previous version is unaffected
+    activities = project['activities'].copy()
+    for column, value in values.items():
+        activities.loc[rows, column] = value
+    project['activities'] = activities
+    
+    # Bump the version and drop only this project's cached results
+    project['version'] += 1
+    for key in [k for k in service['cache'] if k[0] == project_id]:
+        del service['cache'][key]
+    return project['version']
+
+def project_day(project, query):
+    if 'day' in query:
+        return int(query['day'][0])
+    return max(0, (datetime.now() - project['start_date']).days)
+
+async def handle_query(service, method, path, query, body):
+    parts = [p for p in path.split('/') if p]
+    if parts == ['projects'] and method == 'GET':
+        return 200, {project_id: {'version': p['version']} for project_id, p in service['projects'].items()}
+    
+    if len(parts) < 2 or parts[0] != 'projects' or parts[1] not in service['projects']:
+        return 404, {'error': 'unknown project'}
+    project_id = parts[1]
+    project = service['projects'][project_id]
+    
+    if method in ('PUT', 'PATCH') and len(parts) == 4 and parts[2] == 'activities':
+        try:
+            version = update_activity(service, project_id, parts[3], json.loads(body or b'{}'))
+        except KeyError:
+            return 404, {'error': 'unknown activity'}
+        except (TypeError, ValueError) as e:
+            return 400, {'error': str(e)}
+        return 200, {'project': project_id, 'version': version}
+    
+    if method != 'GET':
+        return 405, {'error': 'method not allowed'}
+    
+    bundle = await get_bundle(service, project_id)
+    resource = parts[2] if len(parts) > 2 else None
+    
+    if resource is None:
+        return 200, {'project': project_id, 'version': project['version'],
+                     'project_duration': bundle['project_duration']}
+    if resource == 'critical-path':
+        return 200, {'project_duration': bundle['project_duration'], 'critical_paths': bundle['critical_paths']}
+    if resource == 'activities' and len(parts) == 4:
+        activity = bundle['activities'].get(parts[3])
+        if activity is None:
+            return 404, {'error': 'unknown activity'}
+        return 200, activity
+    if resource == 'crew-demand':
+        try:
+            start = project_day(project, query)
+            days = int(query.get('days', ['7'])[0])
+        except ValueError:
+            return 400, {'error': 'day and days must be integers'}
+        response = {'start_day': start, 'days': days}
+        for name, demand in bundle['crew_demand'].items():
+            last = len(demand['daily'])
+            lo, hi = min(max(start, 0), last), min(max(start + days, 0), last)
+            response[name] = {
+                'total_crew_days': float(demand['cumulative'][hi] - demand['cumulative'][lo]),
+                'peak': float(demand['daily'][lo:hi].max()) if hi > lo else 0.0
+            }
+        return 200, response
+    if resource == 'evm':
+        return 200, await asyncio.to_thread(evaluate_evm, project['activities'], datetime.now())
+    return 404, {'error': 'unknown query'}
+
+async def handle_connection(service, reader, writer):
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            method, target, _ = request_line.decode('latin-1').split(' ', 2)
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get('content-length', 0)))
+    
+            url = urlsplit(target)
+            status, payload = await handle_query(service, method, url.path, parse_qs(url.query), body)
+            data = json.dumps(payload).encode()
+            keep_alive = headers.get('connection', '').lower() != 'close'
+            writer.write(
+                f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data
+            )
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+async def serve(service, host, port):
+    # Warm the cache so the first site query does not pay for the CPM run
+    for project_id in service['projects']:
+        await get_bundle(service, project_id)
+    
+    server = await asyncio.start_server(lambda r, w: handle_connection(service, r, w), host, port)
+    print(f"Serving {len(service['projects'])} project(s) on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+parser = argparse.ArgumentParser(description='Serve cached schedule queries over HTTP')
+parser.add_argument('--host', default='127.0.0.1')
+parser.add_argument('--port', type=int, default=8080)
+parser.add_argument('--cache-size', type=int, default=64, help='number of project versions kept in memory')
+args = parser.parse_args()
+
+service = create_service(args.cache_size)
+add_project(service, 'taiwan-174-day', activities_data, dependencies_data, datetime(2024, 1, 1))
+
+print("\nSCHEDULE QUERY SERVICE")
+print("=" * 80)
+print("GET  /projects")
+print("GET  /projects/<id>/critical-path")
+print("GET  /projects/<id>/activities/<code>")
+print("GET  /projects/<id>/crew-demand?day=<day>&days=7")
+print("GET  /projects/<id>/evm")
+print("PUT  /projects/<id>/activities/<code>   {\"Duration\": 10}")
+asyncio.run(serve(service, args.host, args.port))
@@ -0,0 +1,201 @@
+import pandas as pd
+import argparse
+import ast
+import functools
+import importlib
+import inspect
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+# Analysis functions defined in the scripts, plus library calls patched where they live
+DEFAULT_STAGES = [
+    'calculate_cpm',
+    'calculate_resource_metrics',
+    'analyze_resources',
+    'analyze_risks',
+    'simulate_risk_register',
+    'calculate_schedule_sensitivity',
+    'perform_earned_value_analysis',
+    'create_gantt_chart',
+    'create_custom_network_diagram',
+    'networkx.topological_sort',
+    'plotly.figure_factory.create_gantt'
+]
+
+def create_recorder(track_memory=False):
+    return {
+        'track_memory': track_memory,
+        'origin': time.perf_counter(),
+        'events': [],
+        'stack': []
+    }
+
+def enter_stage(recorder, name):
+    frame = {'name': name, 'start': time.perf_counter(), 'peak': 0}
+    if recorder['track_memory']:
+        # Remember the enclosing stage's peak so far before measuring this one from zero
+        current, peak = tracemalloc.get_traced_memory()
+        if recorder['stack']:
+            recorder['stack'][-1]['peak'] = max(recorder['stack'][-1]['peak'], peak - recorder['stack'][-1]['base'])
+        tracemalloc.reset_peak()
+        frame['base'] = current
+    recorder['stack'].append(frame)
+
+def exit_stage(recorder):
+    frame = recorder['stack'].pop()
+    end = time.perf_counter()
+    event = {
+        'name': frame['name'],
+        'ph': 'X',
+        'ts': (frame['start'] - recorder['origin']) * 1e6,
+        'dur': (end - frame['start']) * 1e6,
+        'pid': os.getpid(),
+        'tid': threading.get_ident(),
+        'args': {'depth': len(recorder['stack'])}
+    }
+    if recorder['track_memory']:
+        _, peak = tracemalloc.get_traced_memory()
+        stage_peak = max(frame['peak'], peak - frame['base'])
+        event['args']['peak_memory_bytes'] = stage_peak
+        # The enclosing stage saw at least this stage's allocations on top of its own base
+        if recorder['stack']:
+            parent = recorder['stack'][-1]
+            parent['peak'] = max(parent['peak'], frame['base'] - parent['base'] + stage_peak)
+        tracemalloc.reset_peak()
+    recorder['events'].append(event)
+
+def stage_wrapper(recorder, name, func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        enter_stage(recorder, name)
+        try:
+            result = func(*args, **kwargs)
+            # Generator functions (e.g. nx.topological_sort) do their work while being
+            # consumed, so drain them inside the stage and hand back an iterator
+            if inspect.isgenerator(result):
+                result = iter(list(result))
+            return result
+        finally:
+            exit_stage(recorder)
+    return wrapper
+
+def instrument_source(source, filename, stage_names):
+    # Add a stage decorator to every top-level function whose name is a stage
+    tree = ast.parse(source, filename=filename)
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name in stage_names:
+            node.decorator_list.append(ast.Call(
+                func=ast.Name(id='__stage__', ctx=ast.Load()),
+                args=[ast.Constant(value=node.name)],
+                keywords=[]
+            ))
+    return compile(ast.fix_missing_locations(tree), filename, 'exec')
+
+def patch_library_stages(recorder, stage_names):
+    patches = []
+    for stage in stage_names:
+        if '.' not in stage:
+            continue
+        module_name, attribute = stage.rsplit('.', 1)
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        original = getattr(module, attribute, None)
+        if original is None:
+            continue
+        setattr(module, attribute, stage_wrapper(recorder, stage, original))
+        patches.append((module, attribute, original))
+    return patches
+
+def disable_show():
+    # Keep figure windows and browser tabs from blocking a profiling run
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+    except ImportError:
+        pass
+    try:
+        import plotly.graph_objects as go
+        go.Figure.show = lambda self, *args, **kwargs: None
+    except ImportError:
+        pass
+
+def profile_script(path, stage_names, track_memory=False):
+    recorder = create_recorder(track_memory)
+    with open(path, encoding='utf-8') as f:
+        code = instrument_source(f.read(), path, stage_names)
+    
+    namespace = {
+        '__name__': '__main__',
+        '__file__': os.path.abspath(path),
+        '__stage__': lambda name: lambda func: stage_wrapper(recorder, name, func)
+    }
+    
+    patches = patch_library_stages(recorder, stage_names)
+    if track_memory:
+        tracemalloc.start()
+    try:
+        enter_stage(recorder, os.path.basename(path))
+        try:
+            exec(code, namespace)
+        finally:
+            exit_stage(recorder)
+    finally:
+        if track_memory:
+            tracemalloc.stop()
+        for module, attribute, original in patches:
+            setattr(module, attribute, original)
+    
+    return recorder
+
+def summarize_stages(recorder):
+    events = pd.DataFrame([
+        {'Stage': e['name'], 'Seconds': e['dur'] / 1e6, 'Peak_Memory_MB': e['args'].get('peak_memory_bytes', 0) / 2**20}
+        for e in recorder['events']
+    ])
+    summary = events.groupby('Stage', sort=False).agg(
+        Calls=('Seconds', 'size'),
+        Total_Seconds=('Seconds', 'sum'),
+        Mean_Seconds=('Seconds', 'mean'),
+        Peak_Memory_MB=('Peak_Memory_MB', 'max')
+    ).reset_index()
+    if not recorder['track_memory']:
+        summary = summary.drop(columns='Peak_Memory_MB')
+    return summary.sort_values('Total_Seconds', ascending=False, ignore_index=True)
+
+def write_trace(recorder, path, summary):
+    # Chrome trace format: open in chrome://tracing or https://ui.perfetto.dev
+    trace = {
+        'traceEvents': recorder['events'],
+        'displayTimeUnit': 'ms',
+        'otherData': {'summary': summary.to_dict('records')}
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(trace, f, indent=1)
+
+parser = argparse.ArgumentParser(description='Run an analysis script with per-stage timing')
+parser.add_argument('script', help='analysis script to run, e.g. "Risk Analysis.py"')
+parser.add_argument('--stages', nargs='+', default=DEFAULT_STAGES,
+                    help='function names in the script or dotted library functions to time')
+parser.add_argument('--memory', action='store_true', help='track peak memory per stage (slower)')
+parser.add_argument('--trace', help='write a Chrome trace JSON file')
+parser.add_argument('--no-show', action='store_true', help='suppress plt.show() / fig.show()')
+args = parser.parse_args()
+
+if args.no_show:
+    disable_show()
+
+recorder = profile_script(args.script, set(args.stages), track_memory=args.memory)
+summary = summarize_stages(recorder)
+
+print("\nSTAGE PROFILE")
+print("=" * 80)
+print(summary.to_string(index=False, float_format=lambda v: f"{v:.4f}"))
+
+if args.trace:
+    write_trace(recorder, args.trace, summary)
+    print(f"\nTrace written to {args.trace}")
@@ -0,0 +1,80 @@
+import pandas as pd
+import numpy as np
+
+def generate_project(n_activities, depth=50, density=1.5, resource_profile=None, pert_spread=(0.2, 0.5),
+                     seed=42):
+    rng = np.random.default_rng(seed)
+    depth = max(1, min(depth, n_activities))
+    
+    if resource_profile is None:
+        # Same crew shape as the sample data: 0-2 foremen and 0-3 workers per activity
+        resource_profile = {'Foremen': (0, 2), 'Workers': (0, 3)}
+    
+    codes = np.array([f'ACT{i:06d}' for i in range(n_activities)])
+    
+    # Spread activities over `depth` layers; the first activity of every layer keeps the
+    # network depth exact, the rest are placed at random
+    layers = np.sort(np.concatenate([
+        np.arange(depth),
+        rng.integers(0, depth, size=n_activities - depth)
+    ]))
+    layer_start = np.searchsorted(layers, np.arange(depth))
+    layer_end = np.searchsorted(layers, np.arange(depth), side='right')
+    
+    # Each activity outside the first layer links to ~density predecessors, always one in
+    # the previous layer and the others anywhere earlier in the network
+    n_links = np.maximum(1, rng.poisson(density, size=n_activities))
+    prior_activities = []
+    for i in range(n_activities):
+        layer = layers[i]
+        if layer == 0:
+            prior_activities.append('-')
+            continue
+        preds = {rng.integers(layer_start[layer - 1], layer_end[layer - 1])}
+        if n_links[i] > 1:
+            preds.update(rng.integers(0, layer_start[layer], size=n_links[i] - 1).tolist())
+        prior_activities.append(','.join(codes[sorted(preds)]))
+    
+    # Durations and PERT estimates
+    most_likely = rng.integers(1, 15, size=n_activities)
+    low_spread, high_spread = pert_spread
+    optimistic = np.maximum(1, np.floor(most_likely * (1 - rng.uniform(0, low_spread, n_activities))))
+    pessimistic = np.ceil(most_likely * (1 + rng.uniform(0, high_spread, n_activities)))
+    
+    # Costs and progress in the same shape as the earned value data
+    budget_cost = most_likely * 1000
+    actual_cost = np.round(budget_cost * rng.lognormal(0, 0.05, n_activities), -1)
+    percent_complete = np.clip(100 - layers * 100 // depth + rng.integers(-10, 10, n_activities), 0, 100)
+    
+    activities_df = pd.DataFrame({
+        'Activity_Code': codes,
+        'Duration': most_likely,
+        'Optimistic': optimistic.astype(int),
+        'Most_Likely': most_likely,
+        'Pessimistic': pessimistic.astype(int),
+        'Budget_Cost': budget_cost,
+        'Actual_Cost': actual_cost,
+        'Percent_Complete': percent_complete
+    })
+    for resource, (low, high) in resource_profile.items():
+        activities_df[resource] = rng.integers(low, high + 1, size=n_activities)
+    
+    dependencies_df = pd.DataFrame({
+        'Activity_Code': codes,
+        'Prior_Activities': prior_activities
+    })
+    
+    return activities_df, dependencies_df
+
+# Generate a sample synthetic project
+activities_data, dependencies_data = generate_project(1000, depth=40)
+
+# Print Results
+print("\nSYNTHETIC PROJECT")
+print("=" * 80)
+print(f"Activities: {len(activities_data)}")
+print(f"Links: {dependencies_data['Prior_Activities'].str.count(',').add(1)[dependencies_data['Prior_Activities'] != '-'].sum()}")
+print("\nSample Activities:")
+print(activities_data.head(10).to_string(index=False))
+print("\nSample Dependencies:")
+print(dependencies_data.tail(10).to_string(index=False))
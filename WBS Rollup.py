@@ -0,0 +1,309 @@
+import pandas as pd
+import numpy as np
+import networkx as nx
+import plotly.express as px
+from datetime import datetime, timedelta
+
+# Create activities dataframe with cost, progress and resource data
+activities_data = pd.DataFrame({
+    'Activity_Code': ['A', 'B', 'C1', 'C2', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N',
+                     'O1', 'O2', 'P1', 'P2', 'P3', 'Q1', 'Q2', 'R1', 'R2', 'R3', 'S1', 'S2', 'S3',
+                     'T1', 'T2', 'U', 'V', 'W1', 'W2', 'X', 'Y'],
+    'Duration': [1, 8, 2, 7, 3, 7, 3, 6, 4, 3, 5, 2, 3, 9, 8,
+                 2, 2, 2, 2, 2, 22, 22, 3, 3, 3, 2, 2, 2,
+                 3, 3, 12, 12, 8, 8, 6, 1],
+    'Budget_Cost': [1000, 8000, 2000, 7000, 3000, 7000, 3000, 6000, 4000, 3000, 5000, 2000, 3000,
+                    9000, 8000, 2000, 2000, 2000, 2000, 2000, 22000, 22000, 3000, 3000, 3000,
+                    2000, 2000, 2000, 3000, 3000, 12000, 12000, 8000, 8000, 6000, 1000],
+    'Actual_Cost': [1200, 7800, 2200, 7500, 2800, 7200, 3100, 6200, 4200, 2900, 5100, 1900, 3200,
+                    9500, 8200, 1900, 2100, 2100, 1900, 2200, 23000, 21500, 3200, 2900, 3100,
+                    1900, 2100, 2000, 3200, 2900, 12500, 12200, 8300, 7800, 6200, 900],
+    'Percent_Complete': [100, 100, 100, 100, 100, 90, 85, 80, 75, 70, 65, 60, 55, 50, 45,
+                        40, 35, 30, 25, 20, 15, 10, 5, 5, 0, 0, 0, 0,
+                        0, 0, 0, 0, 0, 0, 0, 0],
+    'Foremen': [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+                1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 1, 1, 1,
+                1, 1, 1, 1, 1, 1, 1, 2],
+    'Workers': [2, 2, 2, 2, 2, 2, 2, 2, 3, 2, 2, 2, 2, 2, 2,
+                2, 2, 2, 2, 2, 2, 2, 3, 3, 3, 2, 2, 2,
+                2, 2, 2, 2, 2, 2, 2, 0]
+})
+
+# Create dependencies dataframe
+dependencies_data = pd.DataFrame({
+    'Activity_Code': activities_data['Activity_Code'],
+    'Prior_Activities': ['-', 'A', 'B', 'C1', 'C2', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M',
+                        'M', 'O1', 'M', 'P1', 'P2', 'N,O2,P3', 'Q1', 'Q2', 'R1', 'R2', 'Q2', 'S1', 'S2',
+                        'R3,S3', 'T1', 'T2', 'U', 'V', 'W1', 'W2', 'X']
+})
+
+# Work breakdown structure of the sample project (work types from taiwan-construction-data.txt)
+wbs_structure = {
+    '1 Substructure': {
+        '1.1 Site Preparation': ['A', 'B'],
+        '1.2 Foundation': ['C1', 'C2', 'D', 'E', 'F', 'G']
+    },
+    '2 Structure': {
+        '2.1 Frame': ['I', 'J', 'K', 'L'],
+        '2.2 Walls': ['M', 'N']
+    },
+    '3 Envelope': {
+        '3.1 Doors and Windows': ['O1', 'O2', 'P1', 'P2', 'P3'],
+        '3.2 Roof': ['Q1', 'Q2']
+    },
+    '4 Services': {
+        '4.1 MEP Rough-In': ['H'],
+        '4.2 Electrical': ['R1', 'R2', 'R3'],
+        '4.3 Plumbing': ['S1', 'S2', 'S3']
+    },
+    '5 Finishing': {
+        '5.1 Ceiling': ['T1', 'T2'],
+        '5.2 Flooring': ['U', 'V'],
+        '5.3 Painting': ['W1', 'W2'],
+        '5.4 Landscaping and Inspection': ['X', 'Y']
+    }
+}
+
+def calculate_cpm(activities_df, dependencies_df):
+    G = nx.DiGraph()
+    
+    for _, row in activities_df.iterrows():
+        G.add_node(row['Activity_Code'], duration=row['Duration'])
+    
+    for _, row in dependencies_df.iterrows():
+        if pd.notna(row['Prior_Activities']) and row['Prior_Activities'] != '-':
+            predecessors = row['Prior_Activities'].split(',')
+            for pred in predecessors:
+                G.add_edge(pred.strip(), row['Activity_Code'])
+    
+    early_times = {}
+    for node in nx.topological_sort(G):
+        predecessors = list(G.predecessors(node))
+        if not predecessors:
+            early_times[node] = {'ES': 0, 'EF': G.nodes[node]['duration']}
+        else:
+            es = max(early_times[p]['EF'] for p in predecessors)
+            early_times[node] = {
+                'ES': es,
+                'EF': es + G.nodes[node]['duration']
+            }
+    
+    late_times = {}
+    project_duration = max(t['EF'] for t in early_times.values())
+    
+    for node in reversed(list(nx.topological_sort(G))):
+        successors = list(G.successors(node))
+        if not successors:
+            late_times[node] = {
+                'LF': project_duration,
+                'LS': project_duration - G.nodes[node]['duration']
+            }
+        else:
+            lf = min(late_times[s]['LS'] for s in successors)
+            late_times[node] = {
+                'LF': lf,
+                'LS': lf - G.nodes[node]['duration']
+            }
+    
+    results_df = pd.DataFrame({
+        'Activity': list(G.nodes()),
+        'Duration': [G.nodes[n]['duration'] for n in G.nodes()],
+        'ES': [early_times[n]['ES'] for n in G.nodes()],
+        'EF': [early_times[n]['EF'] for n in G.nodes()],
+        'LS': [late_times[n]['LS'] for n in G.nodes()],
+        'LF': [late_times[n]['LF'] for n in G.nodes()],
+        'Total_Float': [late_times[n]['LS'] - early_times[n]['ES'] for n in G.nodes()]
+    })
+    
+    return {
+        'project_duration': project_duration,
+        'results': results_df
+    }
+
+# Additive roll-ups are updated by deltas; date and float roll-ups by min/max over children
+SUM_FIELDS = ['Budget_Cost', 'Earned_Value', 'Actual_Cost']
+MIN_FIELDS = ['Start', 'Total_Float']
+MAX_FIELDS = ['Finish']
+RESOURCES = ['Foremen', 'Workers']
+
+# Leaf fields update_activity can change; schedule fields (Duration, ES, EF, float) would
+# also move successors, so date changes need a new CPM run and build_wbs
+UPDATABLE_FIELDS = ['Budget_Cost', 'Actual_Cost', 'Percent_Complete'] + RESOURCES
+
+def leaf_values(activity):
+    return {
+        'Budget_Cost': activity['Budget_Cost'],
+        'Earned_Value': activity['Budget_Cost'] * activity['Percent_Complete'] / 100,
+        # Same actual cost convention as perform_earned_value_analysis
+        'Actual_Cost': activity['Actual_Cost'] * activity['Percent_Complete'] / 100,
+        'Start': activity['ES'],
+        'Finish': activity['EF'],
+        'Total_Float': activity['Total_Float']
+    }
+
+def build_wbs(structure, activities_df, cpm_results, root='0 Project'):
+    names, parent, depth = [root], [-1], [0]
+    
+    def add_children(tree, parent_node, level):
+        for name, subtree in tree.items():
+            names.append(name)
+            parent.append(parent_node)
+            depth.append(level)
+            node = len(names) - 1
+            if isinstance(subtree, dict):
+                add_children(subtree, node, level + 1)
+            else:
+                for code in subtree:
+                    names.append(code)
+                    parent.append(node)
+                    depth.append(level + 1)
+    
+    add_children(structure, 0, 1)
+    parent = np.array(parent)
+    depth = np.array(depth)
+    n = len(names)
+    children = [[] for _ in range(n)]
+    for node in range(1, n):
+        children[parent[node]].append(node)
+    
+    activities = activities_df.merge(cpm_results['results'][['Activity', 'ES', 'EF', 'Total_Float']],
+                                     left_on='Activity_Code', right_on='Activity')
+    activities[UPDATABLE_FIELDS] = activities[UPDATABLE_FIELDS].astype(np.float64)
+    leaf_of = {code: node for node, code in enumerate(names) if not children[node]}
+    missing = set(activities['Activity_Code']) - set(leaf_of)
+    if missing:
+        raise ValueError(f"Activities not placed in the WBS: {', '.join(sorted(missing))}")
+    
+    leaves = np.array([leaf_of[code] for code in activities['Activity_Code']])
+    values = {field: np.zeros(n) for field in SUM_FIELDS}
+    values.update({field: np.full(n, np.inf) for field in MIN_FIELDS})
+    values.update({field: np.full(n, -np.inf) for field in MAX_FIELDS})
+    for field, column in leaf_values(activities).items():
+        values[field][leaves] = column.to_numpy(dtype=np.float64)
+    
+    # Daily crew demand per node; leaves from difference arrays
+    horizon = int(activities['EF'].max())
+    profiles = {}
+    for resource in RESOURCES:
+        delta = np.zeros((n, horizon + 1))
+        np.add.at(delta, (leaves, activities['ES'].to_numpy()), activities[resource].to_numpy())
+        np.subtract.at(delta, (leaves, activities['EF'].to_numpy()), activities[resource].to_numpy())
+        profiles[resource] = np.cumsum(delta, axis=1)[:, :horizon]
+    
+    # One bottom-up sweep per level precomputes every summary node
+    for level in range(depth.max(), 0, -1):
+        nodes = np.flatnonzero(depth == level)
+        for field in SUM_FIELDS:
+            np.add.at(values[field], parent[nodes], values[field][nodes])
+        for field in MIN_FIELDS:
+            np.minimum.at(values[field], parent[nodes], values[field][nodes])
+        for field in MAX_FIELDS:
+            np.maximum.at(values[field], parent[nodes], values[field][nodes])
+        for resource in RESOURCES:
+            np.add.at(profiles[resource], parent[nodes], profiles[resource][nodes])
+    
+    return {
+        'names': names,
+        'parent': parent,
+        'depth': depth,
+        'children': children,
+        'leaf_of': leaf_of,
+        'activities': activities.set_index('Activity_Code'),
+        'values': values,
+        'profiles': profiles
+    }
+
+def ancestors(wbs, node):
+    node = wbs['parent'][node]
+    while node >= 0:
+        yield node
+        node = wbs['parent'][node]
+
+def update_activity(wbs, activity_code, **changes):
+    # Progress, cost and crew changes to one leaf touch only its ancestors: O(depth) for
+    # sums plus the activity's days of the crew profiles. Dates and float are left as built.
+    # Every change is checked before any is written, so a bad field leaves the WBS unchanged.
+    leaf = wbs['leaf_of'][activity_code]
+    for column, value in changes.items():
+        if column not in UPDATABLE_FIELDS:
+            raise ValueError(f"{column} cannot be updated incrementally; re-run the CPM and build_wbs instead")
+        if isinstance(value, bool) or not isinstance(value, (int, float, np.number)) or not np.isfinite(value):
+            raise ValueError(f"{column} must be a finite number")
+    old = wbs['activities'].loc[activity_code].copy()
+    for column, value in changes.items():
+        wbs['activities'].loc[activity_code, column] = float(value)
+    new = wbs['activities'].loc[activity_code]
+    values = wbs['values']
+    
+    new_values = leaf_values(new)
+    deltas = {field: new_values[field] - values[field][leaf] for field in SUM_FIELDS}
+    for field in SUM_FIELDS:
+        values[field][leaf] = new_values[field]
+    
+    # Dates are fixed, so only the crew amount over the activity's days changes
+    days = slice(int(new['ES']), int(new['EF']))
+    for node in [leaf] + list(ancestors(wbs, leaf)):
+        for resource in RESOURCES:
+            wbs['profiles'][resource][node, days] += new[resource] - old[resource]
+        if node == leaf:
+            continue
+        for field in SUM_FIELDS:
+            values[field][node] += deltas[field]
+
+def wbs_report(wbs, level):
+    nodes = np.flatnonzero(wbs['depth'] == level)
+    values = wbs['values']
+    report = pd.DataFrame({
+        'WBS': [wbs['names'][n] for n in nodes],
+        'Start': values['Start'][nodes].astype(int),
+        'Finish': values['Finish'][nodes].astype(int),
+        'Budget_Cost': values['Budget_Cost'][nodes],
+        'Earned_Value': values['Earned_Value'][nodes],
+        'Actual_Cost': values['Actual_Cost'][nodes],
+        'Total_Float': values['Total_Float'][nodes].astype(int)
+    })
+    report['Percent_Complete'] = report['Earned_Value'] / report['Budget_Cost'] * 100
+    report['CPI'] = report['Earned_Value'] / report['Actual_Cost'].replace(0, np.nan)
+    for resource in RESOURCES:
+        report[f'Peak_{resource}'] = wbs['profiles'][resource][nodes].max(axis=1)
+    return report
+
+def create_wbs_gantt(wbs, level, start_date):
+    report = wbs_report(wbs, level)
+    report['Start_Date'] = [start_date + timedelta(days=int(d)) for d in report['Start']]
+    report['Finish_Date'] = [start_date + timedelta(days=int(d)) for d in report['Finish']]
+    report['Critical'] = np.where(report['Total_Float'] == 0, 'Critical', 'Non-Critical')
+    fig = px.timeline(report, x_start='Start_Date', x_end='Finish_Date', y='WBS', color='Critical',
+                      color_discrete_map={'Critical': 'rgb(255, 100, 100)', 'Non-Critical': 'rgb(100, 149, 237)'},
+                      hover_data=['Budget_Cost', 'Percent_Complete', 'Total_Float'])
+    fig.update_yaxes(autorange='reversed')
+    fig.update_layout(
+        title=f'WBS Level {level} Gantt Chart (Critical Path in Red)',
+        xaxis_title='Date',
+        font=dict(size=10)
+    )
+    return fig
+
+# Build the WBS and roll up the sample project
+cpm_results = calculate_cpm(activities_data, dependencies_data)
+wbs = build_wbs(wbs_structure, activities_data, cpm_results)
+
+# Print Results
+pd.set_option('display.width', 200)
+print("\nWBS ROLL-UP")
+print("=" * 80)
+print("\nPhase Summary (Level 1):")
+print("-" * 50)
+print(wbs_report(wbs, 1).to_string(index=False, float_format=lambda v: f"{v:,.2f}"))
+print("\nWork Package Summary (Level 2):")
+print("-" * 50)
+print(wbs_report(wbs, 2).to_string(index=False, float_format=lambda v: f"{v:,.2f}"))
+
+# Site report for the steel roof: progress, cost and a larger crew, rolled up incrementally
+update_activity(wbs, 'Q1', Percent_Complete=40, Actual_Cost=22500, Workers=4)
+print("\nAfter Steel Roof (Q1) Progress Update:")
+print("-" * 50)
+print(wbs_report(wbs, 1).to_string(index=False, float_format=lambda v: f"{v:,.2f}"))
+
+gantt_fig = create_wbs_gantt(wbs, 2, datetime(2024, 1, 1))
+gantt_fig.show()